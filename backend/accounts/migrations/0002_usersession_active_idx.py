@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-16 14:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Concurrent index creation cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='usersession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user'], name='usersession_active_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.16 on 2026-10-16 14:25
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+import django.db.models.functions.text
+
+
+def check_case_duplicate_emails(apps, schema_editor):
+    """Refuse to continue while emails that differ only by case exist."""
+    User = apps.get_model("accounts", "User")
+    duplicates = list(
+        User.objects.annotate(email_lower=Lower("email"))
+        .values("email_lower")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add user_email_lower_unique: these emails belong to more "
+            "than one user when compared case-insensitively, merge or rename "
+            "those accounts first: " + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    # Concurrent index creation cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0002_usersession_active_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicate_emails, migrations.RunPython.noop),
+        # Build the unique index without locking the table against writes;
+        # the constraint in model state is backed by this index
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "user_email_lower_unique" '
+                    'ON "accounts_user" (LOWER("email"))',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "user_email_lower_unique"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='user',
+                    constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_lower_unique'),
+                ),
+            ],
+        ),
+    ]
@@ -7,6 +7,7 @@ the project management system, including multi-tenant organization support.
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.core.validators import EmailValidator
 from django.utils import timezone
 
@@ -57,6 +58,11 @@ class User(AbstractUser):
         ordering = ["-created_at"]
         verbose_name = "User"
         verbose_name_plural = "Users"
+        constraints = [
+            # Reject addresses that differ only by case, using an index that
+            # also serves case-insensitive lookups
+            models.UniqueConstraint(Lower("email"), name="user_email_lower_unique"),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
@@ -125,6 +131,13 @@ class UserSession(models.Model):
         ordering = ["-last_activity"]
         verbose_name = "User Session"
         verbose_name_plural = "User Sessions"
+        indexes = [
+            models.Index(
+                fields=["user"],
+                condition=models.Q(is_active=True),
+                name="usersession_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.ip_address}"
@@ -25,7 +25,7 @@ class CoreConfig(AppConfig):
         Called when the application is ready.
 
         This method is called when Django starts up and the application
-        is ready to be used. It can be used to register signal handlers
-        or perform other initialization tasks.
+        is ready to be used. It registers the signal handlers that keep
+        cached analytics up to date.
         """
-        pass
+        from core import signals  # noqa: F401
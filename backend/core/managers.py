@@ -7,8 +7,14 @@ data isolation in the multi-tenant system.
 """
 
 from django.db import models
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 
+# Active organizations are looked up on every register and login request
+# but rarely change; cached rows are also dropped when an organization is
+# saved or deleted.
+ORGANIZATION_CACHE_TIMEOUT = 300
+
 
 class OrganizationManager(models.Manager):
     """
@@ -41,6 +47,60 @@ class OrganizationManager(models.Manager):
         """
         return self.filter(is_active=True)
 
+    def get_active_cached(self, pk=None, slug=None):
+        """
+        Get an active organization by ID or slug, going through the cache.
+
+        Slugs are cached as a pointer to the organization ID, so a renamed
+        organization is never returned for its previous slug.
+
+        Args:
+            pk: The organization ID to look up
+            slug: The organization slug to look up, used when pk is not given
+
+        Returns:
+            Organization instance, or None if no active organization matches
+        """
+        if pk is None:
+            pk = cache.get(f"org:slug:{slug}")
+            if pk is None:
+                organization = self.active().filter(slug=slug).first()
+                if organization is not None:
+                    self._cache_organization(organization)
+                return organization
+
+        organization = cache.get(f"org:id:{pk}")
+        if organization is None:
+            organization = self.active().filter(pk=pk).first()
+            if organization is not None:
+                self._cache_organization(organization)
+
+        if organization is not None and slug is not None:
+            if organization.slug != slug:
+                return None
+        return organization
+
+    def _cache_organization(self, organization):
+        """Cache an active organization under its ID and slug."""
+        cache.set_many(
+            {
+                f"org:id:{organization.pk}": organization,
+                f"org:slug:{organization.slug}": organization.pk,
+            },
+            timeout=ORGANIZATION_CACHE_TIMEOUT,
+        )
+
+    def invalidate_cached(self, organization):
+        """
+        Drop an organization from the cache used by get_active_cached.
+
+        Args:
+            organization: The organization that was saved or deleted
+        """
+        cache.delete_many(
+            [f"org:id:{organization.pk}", f"org:slug:{organization.slug}"]
+        )
+
 
 class OrganizationScopedManager(models.Manager):
     """
@@ -120,6 +180,10 @@ class ProjectManager(OrganizationScopedManager):
         """
         Annotate projects with task counts.
 
+        The annotations are picked up by ``Project.task_count``,
+        ``Project.completed_task_count`` and ``Project.completion_rate``, so
+        list views get every project's counts from one grouped query.
+
         Args:
             organization: Optional organization to filter by
 
@@ -135,6 +199,10 @@ class ProjectManager(OrganizationScopedManager):
             completed_tasks=models.Count(
                 "tasks", filter=models.Q(tasks__status="DONE")
             ),
+            in_progress_tasks=models.Count(
+                "tasks", filter=models.Q(tasks__status="IN_PROGRESS")
+            ),
+            todo_tasks=models.Count("tasks", filter=models.Q(tasks__status="TODO")),
         )
 
 
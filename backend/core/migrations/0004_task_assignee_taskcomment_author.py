@@ -0,0 +1,46 @@
+# Generated by Django 4.2.16 on 2026-10-16 11:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def link_users_by_email(apps, schema_editor):
+    """Populate the new user foreign keys from the existing email columns."""
+    User = apps.get_model("accounts", "User")
+    Task = apps.get_model("core", "Task")
+    TaskComment = apps.get_model("core", "TaskComment")
+
+    Task.objects.exclude(assignee_email="").update(
+        assignee=Subquery(
+            User.objects.filter(email=OuterRef("assignee_email")).values("pk")[:1]
+        )
+    )
+    TaskComment.objects.exclude(author_email="").update(
+        author=Subquery(
+            User.objects.filter(email=OuterRef("author_email")).values("pk")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0003_add_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='assignee',
+            field=models.ForeignKey(blank=True, help_text='User assigned to this task, resolved from assignee_email', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='taskcomment',
+            name='author',
+            field=models.ForeignKey(blank=True, help_text='User who wrote this comment, resolved from author_email', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(link_users_by_email, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-16 12:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Concurrent index creation cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0004_task_assignee_taskcomment_author'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(condition=models.Q(('assignee_email__gt', '')), fields=['project', 'assignee_email'], name='task_assigned_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-16 13:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Concurrent index creation cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0005_task_assigned_partial_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(condition=models.Q(('status__in', ['ACTIVE', 'ON_HOLD'])), fields=['due_date'], name='project_overdue_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status__in', ['TODO', 'IN_PROGRESS'])), fields=['due_date'], name='task_overdue_idx'),
+        ),
+    ]
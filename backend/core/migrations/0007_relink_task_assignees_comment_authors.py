@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-16 15:10
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def relink_users_by_email(apps, schema_editor):
+    """Re-point user foreign keys that drifted from their email columns."""
+    User = apps.get_model("accounts", "User")
+    Task = apps.get_model("core", "Task")
+    TaskComment = apps.get_model("core", "TaskComment")
+
+    Task.objects.update(
+        assignee=Subquery(
+            User.objects.filter(email=OuterRef("assignee_email")).values("pk")[:1]
+        )
+    )
+    TaskComment.objects.update(
+        author=Subquery(
+            User.objects.filter(email=OuterRef("author_email")).values("pk")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_email_lower_unique'),
+        ('core', '0006_overdue_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(relink_users_by_email, migrations.RunPython.noop),
+    ]
@@ -5,9 +5,53 @@ This module defines the main data models including Organization, Project,
 Task, and TaskComment with proper multi-tenant architecture support.
 """
 
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.core.validators import EmailValidator
+from core.managers import OrganizationManager, ProjectManager
+
+# Marks an email column that was deferred when the instance was loaded
+_DEFERRED = object()
+
+
+def _sync_user_from_email(instance, save_kwargs, email_field, user_field):
+    """
+    Point ``user_field`` at the user matching ``email_field`` before a save.
+
+    Tasks and comments keep their email columns for compatibility; the user
+    foreign keys mirror them so analytics can join on indexed integer keys.
+    The user is only looked up when the email changed since the instance was
+    loaded, and a partial save that writes the email also writes the user.
+
+    Users that sign up or change their email are re-linked by the User
+    signals in ``core.signals``. ``QuerySet.update()``, ``bulk_create()`` and
+    ``bulk_update()`` bypass ``save()``, so code writing email columns
+    through them must set the user foreign key itself.
+    """
+    update_fields = save_kwargs.get("update_fields")
+    if update_fields is not None:
+        if email_field not in update_fields:
+            return
+        save_kwargs["update_fields"] = {*update_fields, user_field}
+
+    # A still-deferred email was never assigned, so it cannot have changed
+    if email_field not in instance.__dict__:
+        return
+    email = getattr(instance, email_field)
+    if email == getattr(instance, f"_loaded_{email_field}"):
+        return
+
+    user = None
+    if email:
+        user_model = instance._meta.get_field(user_field).related_model
+        user = user_model.objects.filter(email=email).first()
+    setattr(instance, user_field, user)
+
+
+def _loaded_value(instance, field_name):
+    """Return a field's loaded value, or ``_DEFERRED`` if it was not loaded."""
+    return instance.__dict__.get(field_name, _DEFERRED)
 
 
 class TimestampedModel(models.Model):
@@ -47,7 +91,7 @@ class Organization(TimestampedModel):
         default=True, help_text="Whether the organization is active"
     )
 
-    objects = models.Manager()  # Use default manager for now
+    objects = OrganizationManager()
 
     class Meta:
         ordering = ["name"]
@@ -94,13 +138,30 @@ class Project(TimestampedModel):
         null=True, blank=True, help_text="Target completion date for the project"
     )
 
-    objects = models.Manager()  # Use default manager for now
+    objects = ProjectManager()
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
         unique_together = ["organization", "name"]
+        indexes = [
+            models.Index(
+                fields=["organization", "status"], name="project_org_status_idx"
+            ),
+            models.Index(fields=["due_date", "status"], name="project_due_status_idx"),
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(status__in=["ACTIVE", "ON_HOLD"]),
+                name="project_overdue_idx",
+            ),
+            models.Index(
+                fields=["organization", "created_at"], name="project_org_created_idx"
+            ),
+            models.Index(
+                fields=["organization", "updated_at"], name="project_org_updated_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.name}"
@@ -108,19 +169,46 @@ class Project(TimestampedModel):
     @property
     def task_count(self):
         """Return the total number of tasks in this project."""
-        return self.tasks.count()
+        return self._annotated_count("total_tasks", self.tasks.all())
 
     @property
     def completed_task_count(self):
         """Return the number of completed tasks in this project."""
-        return self.tasks.filter(status="DONE").count()
+        return self._annotated_count(
+            "completed_tasks", self.tasks.filter(status="DONE")
+        )
+
+    @property
+    def in_progress_task_count(self):
+        """Return the number of in-progress tasks in this project."""
+        return self._annotated_count(
+            "in_progress_tasks", self.tasks.filter(status="IN_PROGRESS")
+        )
+
+    @property
+    def todo_task_count(self):
+        """Return the number of todo tasks in this project."""
+        return self._annotated_count("todo_tasks", self.tasks.filter(status="TODO"))
 
     @property
     def completion_rate(self):
         """Return the completion rate as a percentage."""
-        if self.task_count == 0:
+        task_count = self.task_count
+        if task_count == 0:
             return 0
-        return (self.completed_task_count / self.task_count) * 100
+        return (self.completed_task_count / task_count) * 100
+
+    def _annotated_count(self, annotation, queryset):
+        """
+        Return an annotated task count, or count ``queryset`` as a fallback.
+
+        Projects loaded through ``Project.objects.with_task_counts`` carry
+        their counts as annotations; other instances query on demand.
+        """
+        count = getattr(self, annotation, None)
+        if count is None:
+            count = queryset.count()
+        return count
 
 
 class Task(TimestampedModel):
@@ -158,6 +246,13 @@ class Task(TimestampedModel):
         validators=[EmailValidator()],
         help_text="Email of the person assigned to this task",
     )
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        help_text="User assigned to this task, resolved from assignee_email",
+    )
     due_date = models.DateTimeField(
         null=True, blank=True, help_text="Due date and time for the task"
     )
@@ -168,10 +263,45 @@ class Task(TimestampedModel):
         ordering = ["-created_at"]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(fields=["project", "status"], name="task_project_status_idx"),
+            models.Index(
+                fields=["project", "assignee_email"], name="task_project_assignee_idx"
+            ),
+            models.Index(
+                fields=["project", "assignee_email"],
+                condition=models.Q(assignee_email__gt=""),
+                name="task_assigned_partial_idx",
+            ),
+            models.Index(
+                fields=["project", "updated_at"], name="task_project_updated_idx"
+            ),
+            models.Index(fields=["due_date", "status"], name="task_due_status_idx"),
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(status__in=["TODO", "IN_PROGRESS"]),
+                name="task_overdue_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.project.name} - {self.title}"
 
+    # assignee_email as last loaded or saved; unsaved tasks have none
+    _loaded_assignee_email = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_assignee_email = _loaded_value(instance, "assignee_email")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save the task, keeping ``assignee`` in sync with ``assignee_email``."""
+        _sync_user_from_email(self, kwargs, "assignee_email", "assignee")
+        super().save(*args, **kwargs)
+        self._loaded_assignee_email = _loaded_value(self, "assignee_email")
+
     @property
     def is_overdue(self):
         """Check if the task is overdue."""
@@ -198,6 +328,13 @@ class TaskComment(TimestampedModel):
     author_email = models.EmailField(
         validators=[EmailValidator()], help_text="Email of the comment author"
     )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        help_text="User who wrote this comment, resolved from author_email",
+    )
 
     objects = models.Manager()  # Use default manager for now
 
@@ -205,6 +342,28 @@ class TaskComment(TimestampedModel):
         ordering = ["-created_at"]
         verbose_name = "Task Comment"
         verbose_name_plural = "Task Comments"
+        indexes = [
+            models.Index(fields=["task", "created_at"], name="comment_task_created_idx"),
+            models.Index(
+                fields=["author_email", "created_at"],
+                name="comment_author_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment on {self.task.title} by {self.author_email}"
+
+    # author_email as last loaded or saved; unsaved comments have none
+    _loaded_author_email = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_author_email = _loaded_value(instance, "author_email")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save the comment, keeping ``author`` in sync with ``author_email``."""
+        _sync_user_from_email(self, kwargs, "author_email", "author")
+        super().save(*args, **kwargs)
+        self._loaded_author_email = _loaded_value(self, "author_email")
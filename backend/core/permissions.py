@@ -17,8 +17,13 @@ from .context import GraphQLContext
 User = get_user_model()
 
 
-class PermissionDenied(Exception):
-    """Custom exception for permission denied errors."""
+class PermissionDenied(GraphQLError):
+    """
+    Custom exception for permission denied errors.
+
+    Subclasses GraphQLError so denials raised from resolvers propagate as
+    regular GraphQL errors without being re-wrapped.
+    """
 
     pass
 
@@ -78,11 +83,8 @@ class IsOrganizationMember(BasePermission):
         if not organization:
             return False
 
-        return (
-            user.organization
-            and user.organization.id == organization.id
-            and organization.is_active
-        )
+        # Compare foreign key IDs so the user's organization is not loaded
+        return user.organization_id == organization.id and organization.is_active
 
     def get_error_message(self):
         """Get error message for organization membership required."""
@@ -298,10 +300,7 @@ def require_permission(*permission_classes):
 
             # Check all required permissions
             for permission_class in permission_classes:
-                try:
-                    check_permission(permission_class, user, organization)
-                except PermissionDenied as e:
-                    raise GraphQLError(str(e))
+                check_permission(permission_class, user, organization)
 
             return func(*args, **kwargs)
 
@@ -359,10 +358,7 @@ def require_object_permission(permission_class, obj_param="id", obj_model=None):
                 raise GraphQLError(f"{obj_model.__name__} not found")
 
             # Check permission
-            try:
-                check_permission(permission_class, user, organization, obj)
-            except PermissionDenied as e:
-                raise GraphQLError(str(e))
+            check_permission(permission_class, user, organization, obj)
 
             return func(*args, **kwargs)
 
@@ -6,12 +6,213 @@ project statistics, user metrics, and organizational analytics. These
 services can be used by GraphQL resolvers, API views, and background tasks.
 """
 
-from django.db.models import Count, Avg, Q, F, Sum, Case, When, IntegerField
+from django.db.models import (
+    Count,
+    Avg,
+    Q,
+    F,
+    Sum,
+    Case,
+    When,
+    IntegerField,
+    FloatField,
+    Value,
+    DurationField,
+    ExpressionWrapper,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Cast, Coalesce, Least, TruncDate
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta, date
-from typing import Dict, List, Optional, Tuple
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
 from core.models import Organization, Project, Task, TaskComment
 
+# Cached analytics expire quickly since the underlying data changes often;
+# bump the version whenever the shape of a cached result changes.
+ANALYTICS_CACHE_TIMEOUT = 60
+ANALYTICS_CACHE_VERSION = 1
+
+
+def _analytics_generation_key(organization_id) -> str:
+    """Return the cache key holding an organization's analytics generation."""
+    return f"org_analytics:{organization_id}:generation"
+
+
+def get_cached_analytics(organization_id, name: str, compute):
+    """
+    Return a cached analytics result for an organization, computing it on a miss.
+
+    Keys embed the organization's current generation, so bumping the
+    generation (see ``invalidate_organization_analytics``) makes every
+    previously cached result for that organization unreachable.
+
+    Args:
+        organization_id: ID of the organization the result belongs to
+        name: Name of the cached result (e.g. ``project_stats``)
+        compute: Callable producing the result on a cache miss
+
+    Returns:
+        The cached or freshly computed result
+    """
+    generation = cache.get_or_set(
+        _analytics_generation_key(organization_id), 0, timeout=None
+    )
+    key = (
+        f"org_analytics:{organization_id}:v{ANALYTICS_CACHE_VERSION}:"
+        f"{generation}:{name}"
+    )
+    return cache.get_or_set(key, compute, timeout=ANALYTICS_CACHE_TIMEOUT)
+
+
+def invalidate_organization_analytics(organization_id) -> None:
+    """
+    Invalidate all cached analytics for an organization.
+
+    Args:
+        organization_id: ID of the organization whose analytics changed
+    """
+    key = _analytics_generation_key(organization_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def correlated_aggregate(queryset, group_by: str, aggregate, output_field):
+    """
+    Wrap a per-key aggregate of ``queryset`` as a scalar subquery.
+
+    The queryset is expected to be filtered on ``OuterRef`` so that it
+    yields at most one group for each outer row.
+
+    Args:
+        queryset: Correlated queryset to aggregate
+        group_by: Field the correlated rows share (e.g. ``assignee``)
+        aggregate: Aggregate expression to compute per group
+        output_field: Model field describing the aggregate's type
+
+    Returns:
+        Subquery expression usable in ``annotate()``
+    """
+    return Subquery(
+        queryset.order_by()
+        .values(group_by)
+        .annotate(value=aggregate)
+        .values("value")[:1],
+        output_field=output_field,
+    )
+
+
+def _project_stats_aggregates(today: date) -> Dict:
+    """Return the aggregate expressions behind the basic project statistics."""
+    return {
+        "total_projects": Count("id"),
+        "active_projects": Count("id", filter=Q(status="ACTIVE")),
+        "completed_projects": Count("id", filter=Q(status="COMPLETED")),
+        "on_hold_projects": Count("id", filter=Q(status="ON_HOLD")),
+        "cancelled_projects": Count("id", filter=Q(status="CANCELLED")),
+        "overdue_projects": Count(
+            "id", filter=Q(due_date__lt=today, status__in=["ACTIVE", "ON_HOLD"])
+        ),
+    }
+
+
+def _task_stats_aggregates(now) -> Dict:
+    """Return the aggregate expressions behind the basic task statistics."""
+    return {
+        "total_tasks": Count("id"),
+        "todo_tasks": Count("id", filter=Q(status="TODO")),
+        "in_progress_tasks": Count("id", filter=Q(status="IN_PROGRESS")),
+        "completed_tasks": Count("id", filter=Q(status="DONE")),
+        "overdue_tasks": Count(
+            "id", filter=Q(due_date__lt=now, status__in=["TODO", "IN_PROGRESS"])
+        ),
+    }
+
+
+def _finalize_project_stats(stats: Dict) -> Dict:
+    """Add the derived completion rate to raw project counts."""
+    total = stats["total_projects"]
+    completed = stats["completed_projects"]
+    stats["completion_rate"] = (completed / total * 100) if total > 0 else 0.0
+    return stats
+
+
+def _finalize_task_stats(stats: Dict, average_completion_time: float) -> Dict:
+    """Add the derived completion rate and average completion time to task counts."""
+    total = stats["total_tasks"]
+    completed = stats["completed_tasks"]
+    stats["completion_rate"] = (completed / total * 100) if total > 0 else 0.0
+    stats["average_completion_time"] = average_completion_time
+    return stats
+
+
+def _build_completion_trend(
+    queryset, completed_status: str, start_date: date, end_date: date
+) -> List[Tuple[date, float]]:
+    """
+    Build a cumulative daily completion-rate series from two grouped queries.
+
+    Rows are counted per creation day and, for completed rows, per day of
+    their last update (which is never earlier than creation). Running totals
+    then give the number of existing and completed rows on each day.
+
+    Args:
+        queryset: Base queryset of projects or tasks
+        completed_status: Status value that counts as completed
+        start_date: First day of the series
+        end_date: Last day of the series
+
+    Returns:
+        List of tuples containing (date, completion_rate_percentage)
+    """
+    created_by_day = dict(
+        queryset.filter(created_at__date__lte=end_date)
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("day", "count")
+    )
+    completed_by_day = dict(
+        queryset.filter(status=completed_status, updated_at__date__lte=end_date)
+        .annotate(day=TruncDate("updated_at"))
+        .values("day")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("day", "count")
+    )
+
+    # Rows created or completed before the window seed the running totals
+    initial_total = sum(
+        count for day, count in created_by_day.items() if day < start_date
+    )
+    initial_completed = sum(
+        count for day, count in completed_by_day.items() if day < start_date
+    )
+
+    days = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    running_totals = accumulate(created_by_day.get(day, 0) for day in days)
+    running_completed = accumulate(completed_by_day.get(day, 0) for day in days)
+
+    trend_data = []
+    for day, created, completed in zip(days, running_totals, running_completed):
+        total_count = initial_total + created
+        completed_count = initial_completed + completed
+        if total_count > 0:
+            completion_rate = (completed_count / total_count) * 100
+        else:
+            completion_rate = 0.0
+        trend_data.append((day, completion_rate))
+
+    return trend_data
+
 
 class ProjectStatisticsService:
     """
@@ -24,33 +225,33 @@ class ProjectStatisticsService:
     def __init__(self, organization: Organization):
         """Initialize the service with an organization context."""
         self.organization = organization
+        self._basic_project_stats = None
 
     def get_basic_project_stats(self) -> Dict:
         """
         Get basic project statistics for the organization.
 
+        Results are cached per organization and invalidated on project changes,
+        and memoized on the service instance for repeated calls.
+
         Returns:
             Dictionary containing total, active, completed, on-hold, and cancelled project counts
         """
-        projects = Project.objects.filter(organization=self.organization)
-
-        stats = projects.aggregate(
-            total_projects=Count("id"),
-            active_projects=Count("id", filter=Q(status="ACTIVE")),
-            completed_projects=Count("id", filter=Q(status="COMPLETED")),
-            on_hold_projects=Count("id", filter=Q(status="ON_HOLD")),
-            cancelled_projects=Count("id", filter=Q(status="CANCELLED")),
-        )
-
-        # Calculate overdue projects
-        stats["overdue_projects"] = self.get_overdue_projects_count()
+        if self._basic_project_stats is None:
+            self._basic_project_stats = get_cached_analytics(
+                self.organization.id,
+                "project_stats",
+                self._compute_basic_project_stats,
+            )
+        return self._basic_project_stats
 
-        # Calculate completion rate
-        total = stats["total_projects"]
-        completed = stats["completed_projects"]
-        stats["completion_rate"] = (completed / total * 100) if total > 0 else 0.0
+    def _compute_basic_project_stats(self) -> Dict:
+        """Compute basic project statistics from the database."""
+        projects = Project.objects.filter(organization=self.organization)
+        today = timezone.now().date()
 
-        return stats
+        stats = projects.aggregate(**_project_stats_aggregates(today))
+        return _finalize_project_stats(stats)
 
     def get_overdue_projects_count(self) -> int:
         """Get count of projects that are overdue."""
@@ -90,28 +291,14 @@ class ProjectStatisticsService:
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=days)
 
-        trend_data = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            # Get projects that existed on this date
-            projects_on_date = Project.objects.filter(
-                organization=self.organization, created_at__date__lte=current_date
-            )
-
-            total_count = projects_on_date.count()
-            if total_count > 0:
-                completed_count = projects_on_date.filter(
-                    status="COMPLETED", updated_at__date__lte=current_date
-                ).count()
-                completion_rate = (completed_count / total_count) * 100
-            else:
-                completion_rate = 0.0
-
-            trend_data.append((current_date, completion_rate))
-            current_date += timedelta(days=1)
-
-        return trend_data
+        projects = Project.objects.filter(organization=self.organization)
+        return get_cached_analytics(
+            self.organization.id,
+            f"project_trend:{end_date}:{days}",
+            lambda: _build_completion_trend(
+                projects, "COMPLETED", start_date, end_date
+            ),
+        )
 
     def calculate_project_health_score(self, project: Project) -> float:
         """
@@ -129,44 +316,53 @@ class ProjectStatisticsService:
         Returns:
             Health score between 0.0 and 100.0
         """
-        tasks = Task.objects.filter(project=project)
-        total_tasks = tasks.count()
+        now = timezone.now()
+        week_ago = now - timedelta(days=7)
+
+        task_stats = Task.objects.filter(project=project).aggregate(
+            total_tasks=Count("id"),
+            completed_tasks=Count("id", filter=Q(status="DONE")),
+            tasks_with_due_dates=Count("id", filter=Q(due_date__isnull=False)),
+            on_time_tasks=Count(
+                "id",
+                filter=Q(
+                    status="DONE",
+                    due_date__isnull=False,
+                    updated_at__lte=F("due_date"),
+                ),
+            ),
+            recent_task_updates=Count("id", filter=Q(updated_at__gte=week_ago)),
+            overdue_tasks=Count(
+                "id", filter=Q(due_date__lt=now, status__in=["TODO", "IN_PROGRESS"])
+            ),
+        )
+        total_tasks = task_stats["total_tasks"]
 
         if total_tasks == 0:
             return 100.0  # New project gets perfect score
 
         # Factor 1: Task completion rate (40% weight)
-        completed_tasks = tasks.filter(status="DONE").count()
-        completion_score = (completed_tasks / total_tasks) * 40
+        completion_score = (task_stats["completed_tasks"] / total_tasks) * 40
 
         # Factor 2: On-time delivery rate (30% weight)
-        tasks_with_due_dates = tasks.exclude(due_date__isnull=True)
-        if tasks_with_due_dates.exists():
-            on_time_tasks = 0
-            for task in tasks_with_due_dates.filter(status="DONE"):
-                if task.updated_at and task.updated_at <= task.due_date:
-                    on_time_tasks += 1
-            on_time_score = (on_time_tasks / tasks_with_due_dates.count()) * 30
+        if task_stats["tasks_with_due_dates"]:
+            on_time_score = (
+                task_stats["on_time_tasks"] / task_stats["tasks_with_due_dates"]
+            ) * 30
         else:
             on_time_score = 30.0  # Perfect score if no due dates
 
         # Factor 3: Recent activity level (20% weight)
-        week_ago = timezone.now() - timedelta(days=7)
         recent_comments = TaskComment.objects.filter(
             task__project=project, created_at__gte=week_ago
         ).count()
-        recent_task_updates = tasks.filter(updated_at__gte=week_ago).count()
-        total_activity = recent_comments + recent_task_updates
+        total_activity = recent_comments + task_stats["recent_task_updates"]
 
         # Normalize activity (assume 10 activities per week is optimal)
         activity_score = min(total_activity / 10, 1.0) * 20
 
         # Factor 4: Overdue penalty (10% deduction)
-        now = timezone.now()
-        overdue_tasks = tasks.filter(
-            due_date__lt=now, status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-        overdue_penalty = (overdue_tasks / total_tasks) * 10
+        overdue_penalty = (task_stats["overdue_tasks"] / total_tasks) * 10
 
         # Calculate final score
         health_score = (
@@ -193,38 +389,35 @@ class TaskStatisticsService:
         """
         self.organization = organization
         self.project = project
+        self._basic_task_stats = None
 
     def get_basic_task_stats(self) -> Dict:
         """
         Get basic task statistics.
 
+        Results are cached per organization (and project, when scoped) and
+        invalidated on task changes, and memoized on the service instance
+        for repeated calls.
+
         Returns:
             Dictionary containing task counts by status and completion metrics
         """
+        if self._basic_task_stats is None:
+            name = f"task_stats:{self.project.id}" if self.project else "task_stats"
+            self._basic_task_stats = get_cached_analytics(
+                self.organization.id, name, self._compute_basic_task_stats
+            )
+        return self._basic_task_stats
+
+    def _compute_basic_task_stats(self) -> Dict:
+        """Compute basic task statistics from the database."""
         if self.project:
             tasks = Task.objects.filter(project=self.project)
         else:
             tasks = Task.objects.filter(project__organization=self.organization)
 
-        stats = tasks.aggregate(
-            total_tasks=Count("id"),
-            todo_tasks=Count("id", filter=Q(status="TODO")),
-            in_progress_tasks=Count("id", filter=Q(status="IN_PROGRESS")),
-            completed_tasks=Count("id", filter=Q(status="DONE")),
-        )
-
-        # Calculate overdue tasks
-        stats["overdue_tasks"] = self.get_overdue_tasks_count()
-
-        # Calculate completion rate
-        total = stats["total_tasks"]
-        completed = stats["completed_tasks"]
-        stats["completion_rate"] = (completed / total * 100) if total > 0 else 0.0
-
-        # Calculate average completion time
-        stats["average_completion_time"] = self.calculate_average_completion_time()
-
-        return stats
+        stats = tasks.aggregate(**_task_stats_aggregates(timezone.now()))
+        return _finalize_task_stats(stats, self.calculate_average_completion_time())
 
     def get_overdue_tasks_count(self) -> int:
         """Get count of tasks that are overdue."""
@@ -255,19 +448,18 @@ class TaskStatisticsService:
                 project__organization=self.organization, status="DONE"
             ).exclude(updated_at__isnull=True)
 
-        if not completed_tasks.exists():
-            return 0.0
-
-        total_hours = 0
-        count = 0
+        average_duration = completed_tasks.aggregate(
+            average=Avg(
+                ExpressionWrapper(
+                    F("updated_at") - F("created_at"), output_field=DurationField()
+                )
+            )
+        )["average"]
 
-        for task in completed_tasks:
-            if task.updated_at and task.created_at:
-                delta = task.updated_at - task.created_at
-                total_hours += delta.total_seconds() / 3600
-                count += 1
+        if average_duration is None:
+            return 0.0
 
-        return total_hours / count if count > 0 else 0.0
+        return average_duration.total_seconds() / 3600
 
     def get_task_distribution_by_assignee(self) -> Dict[str, Dict]:
         """
@@ -281,9 +473,9 @@ class TaskStatisticsService:
         else:
             tasks = Task.objects.filter(project__organization=self.organization)
 
-        # Get assignee statistics
+        # Get assignee statistics, including the completion rate
         assignee_stats = (
-            tasks.exclude(assignee_email="")
+            tasks.filter(assignee_email__gt="")
             .values("assignee_email")
             .annotate(
                 total_tasks=Count("id"),
@@ -291,23 +483,19 @@ class TaskStatisticsService:
                 in_progress_tasks=Count("id", filter=Q(status="IN_PROGRESS")),
                 todo_tasks=Count("id", filter=Q(status="TODO")),
             )
+            .annotate(
+                completion_rate=Case(
+                    When(total_tasks=0, then=Value(0.0)),
+                    default=Cast("completed_tasks", FloatField())
+                    * 100
+                    / F("total_tasks"),
+                    output_field=FloatField(),
+                )
+            )
+            .order_by()
         )
 
-        result = {}
-        for stat in assignee_stats:
-            email = stat["assignee_email"]
-            total = stat["total_tasks"]
-            completed = stat["completed_tasks"]
-
-            result[email] = {
-                "total_tasks": total,
-                "completed_tasks": completed,
-                "in_progress_tasks": stat["in_progress_tasks"],
-                "todo_tasks": stat["todo_tasks"],
-                "completion_rate": (completed / total * 100) if total > 0 else 0.0,
-            }
-
-        return result
+        return {stat.pop("assignee_email"): stat for stat in assignee_stats}
 
     def get_task_completion_trend(self, days: int = 30) -> List[Tuple[date, float]]:
         """
@@ -322,33 +510,18 @@ class TaskStatisticsService:
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=days)
 
-        trend_data = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            if self.project:
-                tasks_on_date = Task.objects.filter(
-                    project=self.project, created_at__date__lte=current_date
-                )
-            else:
-                tasks_on_date = Task.objects.filter(
-                    project__organization=self.organization,
-                    created_at__date__lte=current_date,
-                )
-
-            total_count = tasks_on_date.count()
-            if total_count > 0:
-                completed_count = tasks_on_date.filter(
-                    status="DONE", updated_at__date__lte=current_date
-                ).count()
-                completion_rate = (completed_count / total_count) * 100
-            else:
-                completion_rate = 0.0
-
-            trend_data.append((current_date, completion_rate))
-            current_date += timedelta(days=1)
+        if self.project:
+            tasks = Task.objects.filter(project=self.project)
+            scope = self.project.id
+        else:
+            tasks = Task.objects.filter(project__organization=self.organization)
+            scope = "all"
 
-        return trend_data
+        return get_cached_analytics(
+            self.organization.id,
+            f"task_trend:{scope}:{end_date}:{days}",
+            lambda: _build_completion_trend(tasks, "DONE", start_date, end_date),
+        )
 
 
 class UserProductivityService:
@@ -363,12 +536,19 @@ class UserProductivityService:
         """Initialize the service with an organization context."""
         self.organization = organization
 
-    def get_user_productivity_metrics(self, limit: int = 10) -> List[Dict]:
+    def get_user_productivity_metrics(
+        self, limit: int = 10, prefetch: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
         """
         Get comprehensive user productivity metrics.
 
+        The returned users have their organization loaded via
+        ``select_related``; callers that read further relations should name
+        them in ``prefetch`` to avoid per-user queries while serializing.
+
         Args:
             limit: Maximum number of users to return
+            prefetch: Optional relation names to ``prefetch_related`` on users
 
         Returns:
             List of dictionaries containing user productivity data
@@ -377,102 +557,140 @@ class UserProductivityService:
 
         User = get_user_model()
 
+        week_ago = timezone.now() - timedelta(days=7)
+
+        # Every metric is a subquery correlated on the user's primary key,
+        # which joins through the indexed assignee/author foreign keys
+        assigned_tasks = Task.objects.filter(
+            project__organization=self.organization,
+            assignee=OuterRef("pk"),
+        )
+        authored_comments = TaskComment.objects.filter(
+            task__project__organization=self.organization,
+            author=OuterRef("pk"),
+        )
+
+        users = User.objects.select_related("organization").filter(
+            organization=self.organization
+        )
+        if prefetch:
+            users = users.prefetch_related(*prefetch)
+
         # Get users with comprehensive metrics
-        users = User.objects.filter(organization=self.organization).annotate(
+        users = users.annotate(
             # Task-related metrics
-            total_assigned_tasks=Count(
-                "task",
-                filter=Q(task__project__organization=self.organization),
-                distinct=True,
+            total_assigned_tasks=Coalesce(
+                correlated_aggregate(
+                    assigned_tasks, "assignee", Count("id"), IntegerField()
+                ),
+                0,
             ),
-            completed_assigned_tasks=Count(
-                "task",
-                filter=Q(
-                    task__project__organization=self.organization, task__status="DONE"
+            completed_assigned_tasks=Coalesce(
+                correlated_aggregate(
+                    assigned_tasks.filter(status="DONE"),
+                    "assignee",
+                    Count("id"),
+                    IntegerField(),
                 ),
-                distinct=True,
+                0,
             ),
             # Collaboration metrics
-            comments_made=Count(
-                "taskcomment",
-                filter=Q(taskcomment__task__project__organization=self.organization),
-                distinct=True,
+            comments_made=Coalesce(
+                correlated_aggregate(
+                    authored_comments, "author", Count("id"), IntegerField()
+                ),
+                0,
             ),
             # Project involvement
-            projects_involved=Count(
-                "task__project",
-                filter=Q(task__project__organization=self.organization),
-                distinct=True,
+            projects_involved=Coalesce(
+                correlated_aggregate(
+                    assigned_tasks,
+                    "assignee",
+                    Count("project", distinct=True),
+                    IntegerField(),
+                ),
+                0,
+            ),
+            # Efficiency and recent activity
+            average_completion_time=correlated_aggregate(
+                assigned_tasks.filter(status="DONE"),
+                "assignee",
+                Avg(
+                    ExpressionWrapper(
+                        F("updated_at") - F("created_at"),
+                        output_field=DurationField(),
+                    )
+                ),
+                DurationField(),
+            ),
+            recent_task_updates=Coalesce(
+                correlated_aggregate(
+                    assigned_tasks.filter(updated_at__gte=week_ago),
+                    "assignee",
+                    Count("id"),
+                    IntegerField(),
+                ),
+                0,
+            ),
+            recent_comments=Coalesce(
+                correlated_aggregate(
+                    authored_comments.filter(created_at__gte=week_ago),
+                    "author",
+                    Count("id"),
+                    IntegerField(),
+                ),
+                0,
             ),
         )
 
-        # Calculate additional metrics for each user
-        user_metrics = []
-        for user in users[:limit]:
-            # Calculate completion rate
-            total_tasks = user.total_assigned_tasks
-            completed_tasks = user.completed_assigned_tasks
-            completion_rate = (
-                (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
+        # Rank users by the composite productivity score in the database so
+        # the limit keeps the top scorers rather than an arbitrary subset
+        users = (
+            users.annotate(
+                completion_rate=Case(
+                    When(total_assigned_tasks=0, then=Value(0.0)),
+                    default=Cast("completed_assigned_tasks", FloatField())
+                    * 100
+                    / F("total_assigned_tasks"),
+                    output_field=FloatField(),
+                ),
+                recent_activity_count=F("recent_comments") + F("recent_task_updates"),
             )
+            .annotate(
+                productivity_score=ExpressionWrapper(
+                    F("completion_rate") * 0.4
+                    + F("recent_activity_count") * 0.3
+                    + Least(Cast("total_assigned_tasks", FloatField()) / 10, 1.0)
+                    * 20
+                    + Least(Cast("comments_made", FloatField()) / 5, 1.0) * 10,
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-productivity_score")[:limit]
+        )
 
-            # Calculate average task completion time
-            user_completed_tasks = Task.objects.filter(
-                project__organization=self.organization,
-                assignee_email=user.email,
-                status="DONE",
-            ).exclude(updated_at__isnull=True)
-
-            avg_completion_time = 0.0
-            if user_completed_tasks.exists():
-                total_hours = 0
-                count = 0
-                for task in user_completed_tasks:
-                    if task.updated_at and task.created_at:
-                        delta = task.updated_at - task.created_at
-                        total_hours += delta.total_seconds() / 3600
-                        count += 1
-                avg_completion_time = total_hours / count if count > 0 else 0.0
-
-            # Calculate recent activity (last 7 days)
-            week_ago = timezone.now() - timedelta(days=7)
-            recent_activity = (
-                TaskComment.objects.filter(
-                    author_email=user.email,
-                    task__project__organization=self.organization,
-                    created_at__gte=week_ago,
-                ).count()
-                + Task.objects.filter(
-                    assignee_email=user.email,
-                    project__organization=self.organization,
-                    updated_at__gte=week_ago,
-                ).count()
+        user_metrics = []
+        for user in users:
+            avg_completion_time = (
+                user.average_completion_time.total_seconds() / 3600
+                if user.average_completion_time is not None
+                else 0.0
             )
 
             user_metrics.append(
                 {
                     "user": user,
-                    "total_assigned_tasks": total_tasks,
-                    "completed_assigned_tasks": completed_tasks,
-                    "completion_rate": completion_rate,
+                    "total_assigned_tasks": user.total_assigned_tasks,
+                    "completed_assigned_tasks": user.completed_assigned_tasks,
+                    "completion_rate": user.completion_rate,
                     "comments_made": user.comments_made,
                     "projects_involved": user.projects_involved,
                     "average_completion_time_hours": avg_completion_time,
-                    "recent_activity_count": recent_activity,
+                    "recent_activity_count": user.recent_activity_count,
+                    "productivity_score": user.productivity_score,
                 }
             )
 
-        # Sort by overall productivity score
-        user_metrics.sort(
-            key=lambda x: (
-                x["completion_rate"] * 0.4
-                + x["recent_activity_count"] * 0.3
-                + min(x["total_assigned_tasks"] / 10, 1) * 20
-                + min(x["comments_made"] / 5, 1) * 10
-            ),
-            reverse=True,
-        )
-
         return user_metrics
 
     def get_collaboration_metrics(self) -> Dict:
@@ -496,7 +714,7 @@ class UserProductivityService:
         # Task assignment distribution
         tasks_with_assignees = (
             Task.objects.filter(project__organization=self.organization)
-            .exclude(assignee_email="")
+            .filter(assignee_email__gt="")
             .count()
         )
 
@@ -541,9 +759,22 @@ class OrganizationAnalyticsService:
         """
         Get comprehensive organization analytics.
 
+        Results are cached per organization and invalidated whenever a
+        project, task, or comment in the organization changes.
+
         Returns:
             Dictionary containing all major analytics categories
         """
+        return get_cached_analytics(
+            self.organization.id,
+            "comprehensive",
+            self._compute_comprehensive_analytics,
+        )
+
+    def _compute_comprehensive_analytics(self) -> Dict:
+        """Compute comprehensive organization analytics from the database."""
+        self._load_base_metrics()
+
         return {
             "project_statistics": self.project_service.get_basic_project_stats(),
             "task_statistics": self.task_service.get_basic_task_stats(),
@@ -553,6 +784,66 @@ class OrganizationAnalyticsService:
             "performance_indicators": self.get_key_performance_indicators(),
         }
 
+    def _load_base_metrics(self) -> None:
+        """
+        Load project and task statistics for the organization in one query.
+
+        Every metric is a scalar subquery over its own table, annotated onto
+        the organization row, so the whole set costs a single round trip. The
+        results prime the project and task services so the remaining
+        analytics reuse them instead of querying again.
+        """
+        now = timezone.now()
+        projects = Project.objects.filter(organization=OuterRef("pk"))
+        tasks = Task.objects.filter(project__organization=OuterRef("pk"))
+
+        project_aggregates = _project_stats_aggregates(now.date())
+
+        annotations = {}
+        for name, aggregate in project_aggregates.items():
+            annotations[name] = Coalesce(
+                correlated_aggregate(
+                    projects, "organization", aggregate, IntegerField()
+                ),
+                0,
+            )
+        for name, aggregate in _task_stats_aggregates(now).items():
+            annotations[name] = Coalesce(
+                correlated_aggregate(
+                    tasks, "project__organization", aggregate, IntegerField()
+                ),
+                0,
+            )
+        annotations["average_completion_duration"] = correlated_aggregate(
+            tasks.filter(status="DONE"),
+            "project__organization",
+            Avg(
+                ExpressionWrapper(
+                    F("updated_at") - F("created_at"), output_field=DurationField()
+                )
+            ),
+            DurationField(),
+        )
+
+        metrics = (
+            Organization.objects.filter(pk=self.organization.pk)
+            .annotate(**annotations)
+            .values(*annotations)
+            .get()
+        )
+
+        average_duration = metrics.pop("average_completion_duration")
+        average_completion_time = (
+            average_duration.total_seconds() / 3600 if average_duration else 0.0
+        )
+
+        self.project_service._basic_project_stats = _finalize_project_stats(
+            {key: metrics.pop(key) for key in project_aggregates}
+        )
+        self.task_service._basic_task_stats = _finalize_task_stats(
+            metrics, average_completion_time
+        )
+
     def get_recent_activity_summary(self, days: int = 7) -> Dict:
         """
         Get summary of recent activity across the organization.
@@ -569,20 +860,24 @@ class OrganizationAnalyticsService:
             organization=self.organization, created_at__gte=cutoff_date
         ).count()
 
-        recent_tasks = Task.objects.filter(
-            project__organization=self.organization, created_at__gte=cutoff_date
-        ).count()
+        # New and completed tasks come from a single conditional aggregate
+        task_activity = Task.objects.filter(
+            Q(created_at__gte=cutoff_date)
+            | Q(status="DONE", updated_at__gte=cutoff_date),
+            project__organization=self.organization,
+        ).aggregate(
+            new_tasks=Count("id", filter=Q(created_at__gte=cutoff_date)),
+            tasks_completed=Count(
+                "id", filter=Q(status="DONE", updated_at__gte=cutoff_date)
+            ),
+        )
+        recent_tasks = task_activity["new_tasks"]
+        tasks_completed = task_activity["tasks_completed"]
 
         recent_comments = TaskComment.objects.filter(
             task__project__organization=self.organization, created_at__gte=cutoff_date
         ).count()
 
-        tasks_completed = Task.objects.filter(
-            project__organization=self.organization,
-            status="DONE",
-            updated_at__gte=cutoff_date,
-        ).count()
-
         return {
             "period_days": days,
             "new_projects": recent_projects,
@@ -602,28 +897,23 @@ class OrganizationAnalyticsService:
         Returns:
             Dictionary containing important KPIs and their trends
         """
+        project_stats = self.project_service.get_basic_project_stats()
+        task_stats = self.task_service.get_basic_task_stats()
+
         # Overall completion rates
-        project_completion_rate = self.project_service.get_basic_project_stats()[
-            "completion_rate"
-        ]
-        task_completion_rate = self.task_service.get_basic_task_stats()[
-            "completion_rate"
-        ]
+        project_completion_rate = project_stats["completion_rate"]
+        task_completion_rate = task_stats["completion_rate"]
 
         # Efficiency metrics
-        avg_task_completion_time = self.task_service.calculate_average_completion_time()
+        avg_task_completion_time = task_stats["average_completion_time"]
 
         # Quality metrics
         overdue_project_ratio = (
-            self.project_service.get_overdue_projects_count()
-            / max(Project.objects.filter(organization=self.organization).count(), 1)
+            project_stats["overdue_projects"] / max(project_stats["total_projects"], 1)
         ) * 100
 
         overdue_task_ratio = (
-            self.task_service.get_overdue_tasks_count()
-            / max(
-                Task.objects.filter(project__organization=self.organization).count(), 1
-            )
+            task_stats["overdue_tasks"] / max(task_stats["total_tasks"], 1)
         ) * 100
 
         # Team metrics
@@ -0,0 +1,128 @@
+"""
+Signal handlers for the core application.
+
+This module keeps cached organizations and organization analytics
+consistent by invalidating them whenever organizations, projects, tasks,
+comments, or organization members are created, updated, or deleted, and
+links tasks and comments to users who sign up or change their email.
+"""
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from core.models import Organization, Project, Task, TaskComment
+from core.services import invalidate_organization_analytics
+
+
+@receiver([post_save, post_delete], sender=Organization)
+def invalidate_cached_organization(sender, instance, **kwargs):
+    """Drop an organization from the lookup cache when it changes."""
+    Organization.objects.invalidate_cached(instance)
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project_analytics(sender, instance, **kwargs):
+    """Invalidate cached analytics when a project changes."""
+    invalidate_organization_analytics(instance.organization_id)
+
+
+def _cascaded_from(origin, *models):
+    """Return True if a delete was started by an instance or queryset of ``models``."""
+    if isinstance(origin, QuerySet):
+        return issubclass(origin.model, models)
+    return isinstance(origin, models)
+
+
+def _task_organization_id(task):
+    """Return the organization ID of a task, reusing its loaded project if any."""
+    if Task.project.is_cached(task):
+        return task.project.organization_id
+    return (
+        Project.objects.filter(id=task.project_id)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_task_analytics(sender, instance, origin=None, **kwargs):
+    """Invalidate cached analytics when a task changes."""
+    # Tasks deleted along with their project are covered by the project handler
+    if _cascaded_from(origin, Project):
+        return
+    organization_id = _task_organization_id(instance)
+    if organization_id is not None:
+        invalidate_organization_analytics(organization_id)
+
+
+@receiver([post_save, post_delete], sender=TaskComment)
+def invalidate_comment_analytics(sender, instance, origin=None, **kwargs):
+    """Invalidate cached analytics when a task comment changes."""
+    # Comments deleted along with their task or project are covered by the
+    # handler for that parent
+    if _cascaded_from(origin, Project, Task):
+        return
+    if TaskComment.task.is_cached(instance):
+        organization_id = _task_organization_id(instance.task)
+    else:
+        organization_id = (
+            Task.objects.filter(id=instance.task_id)
+            .values_list("project__organization_id", flat=True)
+            .first()
+        )
+    if organization_id is not None:
+        invalidate_organization_analytics(organization_id)
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def remember_previous_email(sender, instance, update_fields=None, **kwargs):
+    """Record a user's stored email so post_save can tell whether it changed."""
+    # New users and partial saves that skip the email need no lookup
+    if instance._state.adding or (
+        update_fields is not None and "email" not in update_fields
+    ):
+        instance._previous_email = instance.email
+    else:
+        instance._previous_email = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("email", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def link_user_tasks_and_comments(sender, instance, created, **kwargs):
+    """
+    Re-point task assignees and comment authors at a user by email.
+
+    The ``assignee``/``author`` foreign keys mirror the email columns, so
+    when a user signs up or changes their email, rows recorded under the new
+    address are attached to them and rows still under the old one released.
+    """
+    if not created and instance._previous_email == instance.email:
+        return
+    if not created:
+        Task.objects.filter(assignee=instance).exclude(
+            assignee_email=instance.email
+        ).update(assignee=None)
+        TaskComment.objects.filter(author=instance).exclude(
+            author_email=instance.email
+        ).update(author=None)
+    if instance.email:
+        Task.objects.filter(assignee_email=instance.email).exclude(
+            assignee=instance
+        ).update(assignee=instance)
+        TaskComment.objects.filter(author_email=instance.email).exclude(
+            author=instance
+        ).update(author=instance)
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_user_analytics(sender, instance, update_fields=None, **kwargs):
+    """Invalidate cached analytics when an organization's membership changes."""
+    # Logins only touch last_login, which no cached statistic depends on
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    if instance.organization_id is not None:
+        invalidate_organization_analytics(instance.organization_id)
@@ -5,16 +5,41 @@ This module provides common utility functions used across the project
 management system for data processing, calculations, and business operations.
 """
 
+import bleach
+import logging
 import re
 import secrets
-import string
+from functools import lru_cache
 from datetime import datetime, timedelta
 from django.utils import timezone
+from django.db.models import (
+    Avg,
+    CharField,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Max,
+    Q,
+    Value,
+)
 from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from core.models import Organization, Project, Task, TaskComment
+from core.services import get_cached_analytics
+
+logger = logging.getLogger(__name__)
+
+# Patterns used by generate_slug
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_DASHWS = re.compile(r"[-\s]+")
+
+# Markup allowed through sanitize_html_content
+_ALLOWED_TAGS = ["p", "br", "strong", "em", "ul", "ol", "li", "a", "code"]
+_ALLOWED_ATTRS = {"a": ["href", "title"]}
+_ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
 
 def generate_slug(text, max_length=50):
@@ -32,8 +57,8 @@ def generate_slug(text, max_length=50):
     slug = text.lower().strip()
 
     # Remove or replace special characters
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[-\s]+", "-", slug)
+    slug = _SLUG_NONWORD.sub("", slug)
+    slug = _SLUG_DASHWS.sub("-", slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
@@ -59,18 +84,20 @@ def generate_unique_slug(text, model_class, max_length=50, organization=None):
         Unique slug string
     """
     base_slug = generate_slug(text, max_length - 10)  # Reserve space for suffix
-    slug = base_slug
-    counter = 1
 
-    while True:
-        # Check if slug exists
-        queryset = model_class.objects.filter(slug=slug)
-        if organization and hasattr(model_class, "organization"):
-            queryset = queryset.filter(organization=organization)
+    queryset = model_class.objects.all()
+    if organization and hasattr(model_class, "organization"):
+        queryset = queryset.filter(organization=organization)
 
-        if not queryset.exists():
-            return slug
+    # Fetch every slug that could collide in one query and probe locally
+    existing_slugs = set(
+        queryset.filter(slug__startswith=base_slug).values_list("slug", flat=True)
+    )
 
+    slug = base_slug
+    counter = 1
+
+    while slug in existing_slugs:
         # Generate next variation
         suffix = f"-{counter}"
         if len(base_slug) + len(suffix) <= max_length:
@@ -85,9 +112,7 @@ def generate_unique_slug(text, model_class, max_length=50, organization=None):
         # Prevent infinite loops
         if counter > 1000:
             # Use random suffix as fallback
-            random_suffix = "".join(
-                secrets.choice(string.ascii_lowercase + string.digits) for _ in range(6)
-            )
+            random_suffix = secrets.token_hex(3)
             slug = f"{base_slug[:max_length-7]}-{random_suffix}"
             break
 
@@ -104,11 +129,19 @@ def calculate_project_completion_rate(project):
     Returns:
         Completion rate as a percentage (0-100)
     """
-    total_tasks = project.tasks.count()
+    # Projects loaded through Project.objects.with_task_counts() already
+    # carry their counts, so no query is needed
+    total_tasks = getattr(project, "total_tasks", None)
+    completed_tasks = getattr(project, "completed_tasks", None)
+    if total_tasks is None or completed_tasks is None:
+        counts = project.tasks.aggregate(
+            total=Count("id"), completed=Count("id", filter=Q(status="DONE"))
+        )
+        total_tasks, completed_tasks = counts["total"], counts["completed"]
+
     if total_tasks == 0:
         return 0.0
 
-    completed_tasks = project.tasks.filter(status="DONE").count()
     return (completed_tasks / total_tasks) * 100
 
 
@@ -122,8 +155,39 @@ def calculate_project_statistics(project):
     Returns:
         Dictionary with project statistics
     """
-    tasks = project.tasks.all()
-    total_tasks = tasks.count()
+    # Cached results are dropped whenever a project, task or comment in the
+    # organization changes, so the statistics are never stale beyond the TTL
+    # for time-based fields such as overdue counts
+    return get_cached_analytics(
+        project.organization_id,
+        f"project_statistics:{project.id}",
+        lambda: _compute_project_statistics(project),
+    )
+
+
+def _compute_project_statistics(project):
+    """Compute the statistics returned by ``calculate_project_statistics``."""
+    now = timezone.now()
+
+    # Count every status, the overdue tasks, the average completion time and
+    # the latest update in a single aggregate query
+    stats = project.tasks.aggregate(
+        total_tasks=Count("id"),
+        completed_tasks=Count("id", filter=Q(status="DONE")),
+        in_progress_tasks=Count("id", filter=Q(status="IN_PROGRESS")),
+        todo_tasks=Count("id", filter=Q(status="TODO")),
+        overdue_tasks=Count(
+            "id", filter=Q(due_date__lt=now, status__in=["TODO", "IN_PROGRESS"])
+        ),
+        average_completion=Avg(
+            ExpressionWrapper(
+                F("updated_at") - F("created_at"), output_field=DurationField()
+            ),
+            filter=Q(status="DONE"),
+        ),
+        last_activity=Max("updated_at"),
+    )
+    total_tasks = stats["total_tasks"]
 
     if total_tasks == 0:
         return {
@@ -137,40 +201,15 @@ def calculate_project_statistics(project):
             "days_since_last_activity": None,
         }
 
-    completed_tasks = tasks.filter(status="DONE").count()
-    in_progress_tasks = tasks.filter(status="IN_PROGRESS").count()
-    todo_tasks = tasks.filter(status="TODO").count()
-
-    # Calculate overdue tasks
-    now = timezone.now()
-    overdue_tasks = tasks.filter(
-        due_date__lt=now, status__in=["TODO", "IN_PROGRESS"]
-    ).count()
-
-    # Calculate average completion time
-    completed_task_objects = tasks.filter(status="DONE")
-    total_completion_time = 0
-    completion_count = 0
-
-    for task in completed_task_objects:
-        if task.updated_at and task.created_at:
-            completion_time = task.updated_at - task.created_at
-            total_completion_time += completion_time.total_seconds()
-            completion_count += 1
-
+    completed_tasks = stats["completed_tasks"]
+    average_completion = stats["average_completion"]
     average_completion_time = (
-        total_completion_time / completion_count / 3600  # Convert to hours
-        if completion_count > 0
+        average_completion.total_seconds() / 3600  # Convert to hours
+        if average_completion
         else 0.0
     )
 
-    # Calculate days since last activity
-    last_activity = None
-    for task in tasks.order_by("-updated_at"):
-        if task.updated_at:
-            last_activity = task.updated_at
-            break
-
+    last_activity = stats["last_activity"]
     days_since_last_activity = None
     if last_activity:
         days_since_last_activity = (now - last_activity).days
@@ -178,10 +217,10 @@ def calculate_project_statistics(project):
     return {
         "total_tasks": total_tasks,
         "completed_tasks": completed_tasks,
-        "in_progress_tasks": in_progress_tasks,
-        "todo_tasks": todo_tasks,
+        "in_progress_tasks": stats["in_progress_tasks"],
+        "todo_tasks": stats["todo_tasks"],
         "completion_rate": (completed_tasks / total_tasks) * 100,
-        "overdue_tasks": overdue_tasks,
+        "overdue_tasks": stats["overdue_tasks"],
         "average_completion_time": average_completion_time,
         "days_since_last_activity": days_since_last_activity,
     }
@@ -197,66 +236,64 @@ def calculate_organization_statistics(organization):
     Returns:
         Dictionary with organization statistics
     """
-    projects = Project.objects.filter(organization=organization)
-    tasks = Task.objects.filter(project__organization=organization)
+    # Served from the organization analytics cache, which the core signal
+    # handlers invalidate on project, task, comment and user changes
+    return get_cached_analytics(
+        organization.id,
+        "organization_statistics",
+        lambda: _compute_organization_statistics(organization),
+    )
 
-    # Project statistics
-    total_projects = projects.count()
-    active_projects = projects.filter(status="ACTIVE").count()
-    completed_projects = projects.filter(status="COMPLETED").count()
-    on_hold_projects = projects.filter(status="ON_HOLD").count()
-    cancelled_projects = projects.filter(status="CANCELLED").count()
 
-    # Calculate overdue projects
+def _compute_organization_statistics(organization):
+    """Compute the statistics returned by ``calculate_organization_statistics``."""
     now = timezone.now()
-    overdue_projects = projects.filter(
-        due_date__lt=now.date(), status__in=["ACTIVE", "ON_HOLD"]
-    ).count()
-
-    # Task statistics
-    total_tasks = tasks.count()
-    completed_tasks = tasks.filter(status="DONE").count()
-    in_progress_tasks = tasks.filter(status="IN_PROGRESS").count()
-    todo_tasks = tasks.filter(status="TODO").count()
-
-    # Calculate overdue tasks
-    overdue_tasks = tasks.filter(
-        due_date__lt=now, status__in=["TODO", "IN_PROGRESS"]
-    ).count()
-
-    # User statistics
-    users = organization.users.all()
-    total_users = users.count()
-    active_users = users.filter(is_active=True).count()
-    admin_users = users.filter(is_organization_admin=True).count()
+
+    # One conditional aggregate per table instead of a COUNT per figure
+    project_stats = Project.objects.filter(organization=organization).aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(status="ACTIVE")),
+        completed=Count("id", filter=Q(status="COMPLETED")),
+        on_hold=Count("id", filter=Q(status="ON_HOLD")),
+        cancelled=Count("id", filter=Q(status="CANCELLED")),
+        overdue=Count(
+            "id", filter=Q(due_date__lt=now.date(), status__in=["ACTIVE", "ON_HOLD"])
+        ),
+    )
+    task_stats = Task.objects.filter(project__organization=organization).aggregate(
+        total=Count("id"),
+        completed=Count("id", filter=Q(status="DONE")),
+        in_progress=Count("id", filter=Q(status="IN_PROGRESS")),
+        todo=Count("id", filter=Q(status="TODO")),
+        overdue=Count(
+            "id", filter=Q(due_date__lt=now, status__in=["TODO", "IN_PROGRESS"])
+        ),
+    )
+    user_stats = organization.users.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+        admins=Count("id", filter=Q(is_organization_admin=True)),
+    )
+
+    total_projects = project_stats["total"]
+    completed_projects = project_stats["completed"]
+    total_tasks = task_stats["total"]
+    completed_tasks = task_stats["completed"]
 
     return {
         "projects": {
-            "total": total_projects,
-            "active": active_projects,
-            "completed": completed_projects,
-            "on_hold": on_hold_projects,
-            "cancelled": cancelled_projects,
-            "overdue": overdue_projects,
+            **project_stats,
             "completion_rate": (
                 (completed_projects / total_projects * 100) if total_projects > 0 else 0
             ),
         },
         "tasks": {
-            "total": total_tasks,
-            "completed": completed_tasks,
-            "in_progress": in_progress_tasks,
-            "todo": todo_tasks,
-            "overdue": overdue_tasks,
+            **task_stats,
             "completion_rate": (
                 (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
             ),
         },
-        "users": {
-            "total": total_users,
-            "active": active_users,
-            "admins": admin_users,
-        },
+        "users": user_stats,
     }
 
 
@@ -273,61 +310,92 @@ def get_recent_activity(organization, days=7, limit=50):
         List of recent activity items
     """
     cutoff_date = timezone.now() - timedelta(days=days)
-    activities = []
 
-    # Recent projects
-    recent_projects = Project.objects.filter(
-        organization=organization, created_at__gte=cutoff_date
-    ).order_by("-created_at")[: limit // 3]
-
-    for project in recent_projects:
-        activities.append(
-            {
-                "type": "project_created",
-                "timestamp": project.created_at,
-                "description": f"Project '{project.name}' was created",
-                "object_id": project.id,
-                "object_type": "project",
-            }
+    # Each source is shaped into the same annotated columns so the three
+    # feeds can be combined with UNION ALL, sorted and limited in the database
+    def activity_rows(queryset, activity_type, subject, context, author_email):
+        return (
+            queryset.filter(created_at__gte=cutoff_date)
+            .annotate(
+                activity_type=Value(activity_type, output_field=CharField()),
+                timestamp=F("created_at"),
+                object_id=F("id"),
+                subject=subject,
+                context=context,
+                actor_email=author_email,
+            )
+            .values(
+                "activity_type",
+                "timestamp",
+                "object_id",
+                "subject",
+                "context",
+                "actor_email",
+            )
+            .order_by()
         )
 
-    # Recent tasks
-    recent_tasks = Task.objects.filter(
-        project__organization=organization, created_at__gte=cutoff_date
-    ).order_by("-created_at")[: limit // 3]
-
-    for task in recent_tasks:
-        activities.append(
-            {
-                "type": "task_created",
-                "timestamp": task.created_at,
-                "description": f"Task '{task.title}' was created in project '{task.project.name}'",
-                "object_id": task.id,
+    no_value = Value("", output_field=CharField())
+    recent_projects = activity_rows(
+        Project.objects.filter(organization=organization),
+        "project_created",
+        F("name"),
+        no_value,
+        no_value,
+    )
+    recent_tasks = activity_rows(
+        Task.objects.filter(project__organization=organization),
+        "task_created",
+        F("title"),
+        F("project__name"),
+        no_value,
+    )
+    recent_comments = activity_rows(
+        TaskComment.objects.filter(task__project__organization=organization),
+        "comment_added",
+        F("task__title"),
+        no_value,
+        F("author_email"),
+    )
+
+    rows = recent_projects.union(recent_tasks, recent_comments, all=True).order_by(
+        "-timestamp"
+    )[:limit]
+
+    activities = []
+    for row in rows:
+        activity_type = row["activity_type"]
+        if activity_type == "project_created":
+            activity = {
+                "type": activity_type,
+                "timestamp": row["timestamp"],
+                "description": f"Project '{row['subject']}' was created",
+                "object_id": row["object_id"],
+                "object_type": "project",
+            }
+        elif activity_type == "task_created":
+            activity = {
+                "type": activity_type,
+                "timestamp": row["timestamp"],
+                "description": (
+                    f"Task '{row['subject']}' was created in project "
+                    f"'{row['context']}'"
+                ),
+                "object_id": row["object_id"],
                 "object_type": "task",
             }
-        )
-
-    # Recent comments
-    recent_comments = TaskComment.objects.filter(
-        task__project__organization=organization, created_at__gte=cutoff_date
-    ).order_by("-created_at")[: limit // 3]
-
-    for comment in recent_comments:
-        activities.append(
-            {
-                "type": "comment_added",
-                "timestamp": comment.created_at,
-                "description": f"Comment added to task '{comment.task.title}'",
-                "object_id": comment.id,
+        else:
+            activity = {
+                "type": activity_type,
+                "timestamp": row["timestamp"],
+                "description": f"Comment added to task '{row['subject']}'",
+                "object_id": row["object_id"],
                 "object_type": "comment",
-                "author_email": comment.author_email,
+                "author_email": row["actor_email"],
             }
-        )
-
-    # Sort all activities by timestamp
-    activities.sort(key=lambda x: x["timestamp"], reverse=True)
+        activities.append(activity)
 
-    return activities[:limit]
+    return activities
 
 
 def send_notification_email(recipient_email, subject, template_name, context):
@@ -356,9 +424,8 @@ def send_notification_email(recipient_email, subject, template_name, context):
             fail_silently=False,
         )
         return True
-    except Exception as e:
-        # Log the error (in a real application, use proper logging)
-        print(f"Failed to send email to {recipient_email}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to send email to %s", recipient_email)
         return False
 
 
@@ -372,22 +439,17 @@ def sanitize_html_content(content):
     Returns:
         Sanitized HTML content
     """
-    # This is a simple implementation
-    # In production, use a library like bleach for comprehensive HTML sanitization
-
-    # Remove script tags
-    content = re.sub(
-        r"<script[^>]*?>.*?</script>", "", content, flags=re.IGNORECASE | re.DOTALL
+    # bleach tokenizes the markup, so malformed tags cannot slip past it and
+    # long input is processed in linear time. It also escapes &, < and > in
+    # the text, so only pass HTML fields through here, not plain text
+    return bleach.clean(
+        content,
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRS,
+        protocols=_ALLOWED_PROTOCOLS,
+        strip=True,
     )
 
-    # Remove javascript: URLs
-    content = re.sub(r"javascript:", "", content, flags=re.IGNORECASE)
-
-    # Remove on* event handlers
-    content = re.sub(r'on\w+\s*=\s*["\'][^"\']*["\']', "", content, flags=re.IGNORECASE)
-
-    return content
-
 
 def format_duration(seconds):
     """
@@ -464,28 +526,28 @@ def generate_api_key(length=32):
     Returns:
         Generated API key string
     """
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    # One CSPRNG draw, base64url-encoded; 3 bytes encode to 4 characters
+    return secrets.token_urlsafe(length * 3 // 4 + 1)[:length]
 
 
+@lru_cache(maxsize=4096)
 def mask_email(email):
     """
     Mask an email address for privacy.
 
+    Results are memoized because the same addresses recur across listings.
+
     Args:
         email: Email address to mask
 
     Returns:
         Masked email address
     """
-    if "@" not in email:
+    local, at, domain = email.partition("@")
+    if not at:
         return email
 
-    local, domain = email.split("@", 1)
-
     if len(local) <= 2:
-        masked_local = local[0] + "*"
-    else:
-        masked_local = local[0] + "*" * (len(local) - 2) + local[-1]
+        return f"{local[:1]}*@{domain}"
 
-    return f"{masked_local}@{domain}"
+    return f"{local[0]}{'*' * (len(local) - 2)}{local[-1]}@{domain}"
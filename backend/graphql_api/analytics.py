@@ -6,13 +6,37 @@ project completion rates, task statistics, user activity metrics, and
 other business intelligence data with proper organization-scoped access control.
 """
 
+import json
 import graphene
-from django.db.models import Count, Avg, Q
+from django.db.models import (
+    Avg,
+    Case,
+    CharField,
+    Count,
+    DateField,
+    DateTimeField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, ExtractDay, NullIf
 from django.utils import timezone
 from datetime import timedelta
 from graphql import GraphQLError
 from core.models import Organization, Project, Task, TaskComment
 from core.permissions import require_permission, IsAuthenticated, IsOrganizationMember
+from core.services import (
+    ProjectStatisticsService,
+    TaskStatisticsService,
+    correlated_aggregate,
+    get_cached_analytics,
+)
 from .middleware import get_organization_from_context
 from .types import (
     ProjectStatistics,
@@ -72,32 +96,10 @@ class AnalyticsQuery(graphene.ObjectType):
         if not organization:
             raise GraphQLError("Organization context required")
 
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=days)
-
-        trends = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            # Get projects that existed on this date
-            projects_on_date = Project.objects.filter(
-                organization=organization, created_at__date__lte=current_date
-            )
-
-            # Calculate completion rate for this date
-            total_projects = projects_on_date.count()
-            if total_projects > 0:
-                completed_projects = projects_on_date.filter(
-                    status="COMPLETED", updated_at__date__lte=current_date
-                ).count()
-                completion_rate = (completed_projects / total_projects) * 100
-            else:
-                completion_rate = 0.0
-
-            trends.append(completion_rate)
-            current_date += timedelta(days=1)
-
-        return trends
+        # Daily created/completed counts come from two grouped queries and
+        # are accumulated in Python rather than counted once per day
+        service = ProjectStatisticsService(organization)
+        return [rate for _, rate in service.get_project_completion_trend(days)]
 
     @require_permission(IsAuthenticated, IsOrganizationMember)
     def resolve_task_completion_trends(self, info, days=30, project_id=None):
@@ -114,36 +116,13 @@ class AnalyticsQuery(graphene.ObjectType):
             # Verify project belongs to organization
             try:
                 project = Project.objects.get(id=project_id, organization=organization)
-                base_queryset = Task.objects.filter(project=project)
             except Project.DoesNotExist:
                 raise GraphQLError(f"Project with ID {project_id} not found")
+            service = TaskStatisticsService(organization, project)
         else:
-            base_queryset = Task.objects.filter(project__organization=organization)
-
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=days)
+            service = TaskStatisticsService(organization)
 
-        trends = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            # Get tasks that existed on this date
-            tasks_on_date = base_queryset.filter(created_at__date__lte=current_date)
-
-            # Calculate completion rate for this date
-            total_tasks = tasks_on_date.count()
-            if total_tasks > 0:
-                completed_tasks = tasks_on_date.filter(
-                    status="DONE", updated_at__date__lte=current_date
-                ).count()
-                completion_rate = (completed_tasks / total_tasks) * 100
-            else:
-                completion_rate = 0.0
-
-            trends.append(completion_rate)
-            current_date += timedelta(days=1)
-
-        return trends
+        return [rate for _, rate in service.get_task_completion_trend(days)]
 
     @require_permission(IsAuthenticated, IsOrganizationMember)
     def resolve_user_productivity_metrics(self, info, limit=10):
@@ -159,35 +138,54 @@ class AnalyticsQuery(graphene.ObjectType):
         if not organization:
             raise GraphQLError("Organization context required")
 
-        # Get users with productivity metrics
+        # Each metric is an independent subquery correlated on the user, so
+        # no multi-way join or COUNT(DISTINCT) is needed
+        assigned_tasks = Task.objects.filter(
+            project__organization=organization, assignee=OuterRef("pk")
+        )
+        authored_comments = TaskComment.objects.filter(
+            task__project__organization=organization, author=OuterRef("pk")
+        )
+
+        # Get users with productivity metrics. UserType exposes the
+        # organization, so join it rather than issuing a query per user
         users = (
             User.objects.filter(organization=organization)
+            .select_related("organization")
             .annotate(
                 # Count assigned tasks
-                total_assigned_tasks=Count(
-                    "task",
-                    filter=Q(task__project__organization=organization),
-                    distinct=True,
+                total_assigned_tasks=Coalesce(
+                    correlated_aggregate(
+                        assigned_tasks, "assignee", Count("id"), IntegerField()
+                    ),
+                    0,
                 ),
                 # Count completed tasks
-                completed_assigned_tasks=Count(
-                    "task",
-                    filter=Q(
-                        task__project__organization=organization, task__status="DONE"
+                completed_assigned_tasks=Coalesce(
+                    correlated_aggregate(
+                        assigned_tasks.filter(status="DONE"),
+                        "assignee",
+                        Count("id"),
+                        IntegerField(),
                     ),
-                    distinct=True,
+                    0,
                 ),
                 # Count comments made
-                comments_made=Count(
-                    "taskcomment",
-                    filter=Q(taskcomment__task__project__organization=organization),
-                    distinct=True,
+                comments_made=Coalesce(
+                    correlated_aggregate(
+                        authored_comments, "author", Count("id"), IntegerField()
+                    ),
+                    0,
                 ),
                 # Count projects involved in
-                projects_involved=Count(
-                    "task__project",
-                    filter=Q(task__project__organization=organization),
-                    distinct=True,
+                projects_involved=Coalesce(
+                    correlated_aggregate(
+                        assigned_tasks,
+                        "assignee",
+                        Count("project", distinct=True),
+                        IntegerField(),
+                    ),
+                    0,
                 ),
             )
             .order_by(
@@ -217,44 +215,11 @@ class AnalyticsQuery(graphene.ObjectType):
         except Project.DoesNotExist:
             raise GraphQLError(f"Project with ID {project_id} not found")
 
-        tasks = Task.objects.filter(project=project)
-        total_tasks = tasks.count()
-
-        if total_tasks == 0:
-            return 100.0  # New project with no tasks gets perfect score
-
-        # Factor 1: Task completion rate (40% weight)
-        completed_tasks = tasks.filter(status="DONE").count()
-        completion_score = (completed_tasks / total_tasks) * 40
-
-        # Factor 2: On-time delivery rate (30% weight)
-        tasks_with_due_dates = tasks.exclude(due_date__isnull=True)
-        if tasks_with_due_dates.exists():
-            on_time_tasks = tasks_with_due_dates.filter(
-                status="DONE", updated_at__lte=tasks_with_due_dates.first().due_date
-            ).count()
-            on_time_score = (on_time_tasks / tasks_with_due_dates.count()) * 30
-        else:
-            on_time_score = 30.0  # Perfect score if no due dates set
-
-        # Factor 3: Activity level (20% weight)
-        recent_activity = TaskComment.objects.filter(
-            task__project=project, created_at__gte=timezone.now() - timedelta(days=7)
-        ).count()
-        # Normalize activity score (max 10 comments per week = perfect score)
-        activity_score = min(recent_activity / 10, 1.0) * 20
-
-        # Factor 4: Overdue penalty (10% weight)
-        overdue_tasks = tasks.filter(
-            due_date__lt=timezone.now(), status__in=["TODO", "IN_PROGRESS"]
-        ).count()
-        overdue_penalty = (overdue_tasks / total_tasks) * 10
-
-        # Calculate final health score
-        health_score = (
-            completion_score + on_time_score + activity_score - overdue_penalty
+        return get_cached_analytics(
+            organization.id,
+            f"project_health_score:{project.id}",
+            lambda: _calculate_project_health_score(project),
         )
-        return max(0.0, min(100.0, health_score))
 
     @require_permission(IsAuthenticated, IsOrganizationMember)
     def resolve_overdue_items_analysis(self, info):
@@ -264,140 +229,192 @@ class AnalyticsQuery(graphene.ObjectType):
         Returns JSON string containing comprehensive overdue analysis
         including categorization, impact assessment, and recommendations.
         """
-        import json
-
         organization = get_organization_from_context(info)
         if not organization:
             raise GraphQLError("Organization context required")
 
-        now = timezone.now()
-        today = now.date()
-
-        # Analyze overdue projects
-        overdue_projects = Project.objects.filter(
-            organization=organization,
-            due_date__lt=today,
-            status__in=["ACTIVE", "ON_HOLD"],
+        # The serialized JSON is cached, so a hit skips both the queries and
+        # the encoding
+        return get_cached_analytics(
+            organization.id,
+            "overdue_items_analysis",
+            lambda: _build_overdue_items_analysis(organization),
         )
 
-        # Analyze overdue tasks
-        overdue_tasks = Task.objects.filter(
-            project__organization=organization,
-            due_date__lt=now,
-            status__in=["TODO", "IN_PROGRESS"],
+
+def _calculate_project_health_score(project):
+    """Calculate the health score returned by ``project_health_score``."""
+    now = timezone.now()
+
+    def share_of(condition, total, weight):
+        # Weighted fraction of ``total`` matching ``condition``; NULL when
+        # ``total`` is zero
+        return (
+            Cast(Count("id", filter=condition), FloatField())
+            * weight
+            / NullIf(total, 0)
         )
 
-        # Categorize by severity (days overdue)
-        def categorize_overdue_items(items, date_field):
-            categories = {
-                "critical": [],  # >30 days overdue
-                "high": [],  # 15-30 days overdue
-                "medium": [],  # 7-14 days overdue
-                "low": [],  # 1-6 days overdue
-            }
+    # The task-based factors are weighted and summed in one aggregate, so
+    # only the task count and their combined score are returned
+    tasks = Count("id")
+    with_due_date = Count("id", filter=Q(due_date__isnull=False))
+    task_stats = Task.objects.filter(project=project).aggregate(
+        total=tasks,
+        score=(
+            # Factor 1: Task completion rate (40% weight)
+            share_of(Q(status="DONE"), tasks, 40)
+            # Factor 2: On-time delivery rate (30% weight), compared against
+            # each task's own due date; perfect score if no due dates set
+            + Coalesce(
+                share_of(
+                    Q(status="DONE", updated_at__lte=F("due_date")), with_due_date, 30
+                ),
+                Value(30.0),
+            )
+            # Factor 4: Overdue penalty (10% weight)
+            - share_of(
+                Q(due_date__lt=now, status__in=["TODO", "IN_PROGRESS"]), tasks, 10
+            )
+        ),
+    )
 
-            for item in items:
-                due_date = getattr(item, date_field)
-                if isinstance(due_date, timezone.datetime):
-                    days_overdue = (now - due_date).days
-                else:  # date object
-                    days_overdue = (today - due_date).days
-
-                if days_overdue > 30:
-                    categories["critical"].append(
-                        {
-                            "id": str(item.id),
-                            "name": getattr(item, "name", getattr(item, "title", "")),
-                            "days_overdue": days_overdue,
-                        }
-                    )
-                elif days_overdue > 15:
-                    categories["high"].append(
-                        {
-                            "id": str(item.id),
-                            "name": getattr(item, "name", getattr(item, "title", "")),
-                            "days_overdue": days_overdue,
-                        }
-                    )
-                elif days_overdue > 7:
-                    categories["medium"].append(
-                        {
-                            "id": str(item.id),
-                            "name": getattr(item, "name", getattr(item, "title", "")),
-                            "days_overdue": days_overdue,
-                        }
-                    )
-                else:
-                    categories["low"].append(
-                        {
-                            "id": str(item.id),
-                            "name": getattr(item, "name", getattr(item, "title", "")),
-                            "days_overdue": days_overdue,
-                        }
-                    )
+    if task_stats["total"] == 0:
+        return 100.0  # New project with no tasks gets perfect score
 
-            return categories
+    # Factor 3: Activity level (20% weight)
+    recent_activity = TaskComment.objects.filter(
+        task__project=project, created_at__gte=now - timedelta(days=7)
+    ).count()
+    # Normalize activity score (max 10 comments per week = perfect score)
+    activity_score = min(recent_activity / 10, 1.0) * 20
 
-        project_categories = categorize_overdue_items(overdue_projects, "due_date")
-        task_categories = categorize_overdue_items(overdue_tasks, "due_date")
+    # Calculate final health score
+    health_score = task_stats["score"] + activity_score
+    return max(0.0, min(100.0, health_score))
 
-        # Calculate impact metrics
-        total_projects = Project.objects.filter(organization=organization).count()
-        total_tasks = Task.objects.filter(project__organization=organization).count()
 
-        overdue_project_percentage = (
-            (overdue_projects.count() / total_projects * 100)
-            if total_projects > 0
-            else 0
-        )
-        overdue_task_percentage = (
-            (overdue_tasks.count() / total_tasks * 100) if total_tasks > 0 else 0
-        )
+def _build_overdue_items_analysis(organization):
+    """Build the JSON document returned by ``overdue_items_analysis``."""
+    now = timezone.now()
+    today = now.date()
 
-        # Generate recommendations
-        recommendations = []
+    # Analyze overdue projects
+    overdue_projects = Project.objects.filter(
+        organization=organization,
+        due_date__lt=today,
+        status__in=["ACTIVE", "ON_HOLD"],
+    )
 
-        if len(project_categories["critical"]) > 0:
-            recommendations.append(
-                {
-                    "priority": "URGENT",
-                    "message": f"{len(project_categories['critical'])} projects are critically overdue (>30 days). Immediate attention required.",
-                    "action": "Review project scope and deadlines, consider resource reallocation.",
-                }
-            )
+    # Analyze overdue tasks
+    overdue_tasks = Task.objects.filter(
+        project__organization=organization,
+        due_date__lt=now,
+        status__in=["TODO", "IN_PROGRESS"],
+    )
 
-        if len(task_categories["critical"]) > 0:
-            recommendations.append(
-                {
-                    "priority": "HIGH",
-                    "message": f"{len(task_categories['critical'])} tasks are critically overdue. Break down into smaller tasks or reassign.",
-                    "action": "Contact assignees and stakeholders to identify blockers.",
-                }
+    # Categorize by severity (days overdue); the database computes the days
+    # overdue and the bucket, so only four columns per item are fetched
+    def categorize_overdue_items(items, overdue_since, name_field):
+        categories = {
+            "critical": [],  # >30 days overdue
+            "high": [],  # 15-30 days overdue
+            "medium": [],  # 7-14 days overdue
+            "low": [],  # 1-6 days overdue
+        }
+
+        rows = (
+            items.annotate(
+                days_overdue=ExtractDay(
+                    ExpressionWrapper(
+                        overdue_since - F("due_date"), output_field=DurationField()
+                    )
+                )
+            )
+            .annotate(
+                severity=Case(
+                    When(days_overdue__gt=30, then=Value("critical")),
+                    When(days_overdue__gt=15, then=Value("high")),
+                    When(days_overdue__gt=7, then=Value("medium")),
+                    default=Value("low"),
+                    output_field=CharField(),
+                )
             )
+            .values_list("id", name_field, "days_overdue", "severity")
+        )
 
-        if overdue_project_percentage > 20:
-            recommendations.append(
-                {
-                    "priority": "MEDIUM",
-                    "message": f"{overdue_project_percentage:.1f}% of projects are overdue. Review planning processes.",
-                    "action": "Implement better deadline setting and progress tracking.",
-                }
+        # Stream rows in chunks rather than caching the full result set
+        for item_id, name, days_overdue, severity in rows.iterator(chunk_size=500):
+            categories[severity].append(
+                {"id": str(item_id), "name": name, "days_overdue": days_overdue}
             )
 
-        analysis = {
-            "summary": {
-                "overdue_projects_count": overdue_projects.count(),
-                "overdue_tasks_count": overdue_tasks.count(),
-                "overdue_project_percentage": overdue_project_percentage,
-                "overdue_task_percentage": overdue_task_percentage,
-            },
-            "project_categories": project_categories,
-            "task_categories": task_categories,
-            "recommendations": recommendations,
-            "generated_at": now.isoformat(),
-        }
+        return categories
+
+    project_categories = categorize_overdue_items(
+        overdue_projects, Value(today, output_field=DateField()), "name"
+    )
+    task_categories = categorize_overdue_items(
+        overdue_tasks, Value(now, output_field=DateTimeField()), "title"
+    )
+
+    # Calculate impact metrics; overdue counts come from the fetched rows
+    overdue_projects_count = sum(len(items) for items in project_categories.values())
+    overdue_tasks_count = sum(len(items) for items in task_categories.values())
+    total_projects = Project.objects.filter(organization=organization).count()
+    total_tasks = Task.objects.filter(project__organization=organization).count()
+
+    overdue_project_percentage = (
+        (overdue_projects_count / total_projects * 100) if total_projects > 0 else 0
+    )
+    overdue_task_percentage = (
+        (overdue_tasks_count / total_tasks * 100) if total_tasks > 0 else 0
+    )
+
+    # Generate recommendations
+    recommendations = []
+
+    if len(project_categories["critical"]) > 0:
+        recommendations.append(
+            {
+                "priority": "URGENT",
+                "message": f"{len(project_categories['critical'])} projects are critically overdue (>30 days). Immediate attention required.",
+                "action": "Review project scope and deadlines, consider resource reallocation.",
+            }
+        )
+
+    if len(task_categories["critical"]) > 0:
+        recommendations.append(
+            {
+                "priority": "HIGH",
+                "message": f"{len(task_categories['critical'])} tasks are critically overdue. Break down into smaller tasks or reassign.",
+                "action": "Contact assignees and stakeholders to identify blockers.",
+            }
+        )
+
+    if overdue_project_percentage > 20:
+        recommendations.append(
+            {
+                "priority": "MEDIUM",
+                "message": f"{overdue_project_percentage:.1f}% of projects are overdue. Review planning processes.",
+                "action": "Implement better deadline setting and progress tracking.",
+            }
+        )
 
-        return json.dumps(analysis, indent=2)
+    analysis = {
+        "summary": {
+            "overdue_projects_count": overdue_projects_count,
+            "overdue_tasks_count": overdue_tasks_count,
+            "overdue_project_percentage": overdue_project_percentage,
+            "overdue_task_percentage": overdue_task_percentage,
+        },
+        "project_categories": project_categories,
+        "task_categories": task_categories,
+        "recommendations": recommendations,
+        "generated_at": now.isoformat(),
+    }
+
+    return json.dumps(analysis, indent=2)
 
 
 # Export the analytics functionality for use in main query
@@ -5,10 +5,11 @@ This module provides GraphQL mutations for user authentication including
 registration, login, token refresh, and email verification.
 """
 
+import secrets
 import graphene
 from graphql import GraphQLError
 from django.contrib.auth import authenticate, get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from datetime import timedelta
 
@@ -108,49 +109,53 @@ class Register(graphene.Mutation):
             if password_error:
                 errors.append(password_error)
 
-            # Check if user already exists
-            if User.objects.filter(email=input.email).exists():
-                errors.append("User with this email already exists")
-
             # Validate organization if provided
             organization = None
             if input.organization_id:
-                try:
-                    organization = Organization.objects.get(
-                        id=input.organization_id, is_active=True
-                    )
-                except Organization.DoesNotExist:
+                organization = Organization.objects.get_active_cached(
+                    pk=input.organization_id
+                )
+                if organization is None:
                     errors.append("Organization not found or inactive")
 
             if errors:
                 return AuthPayload(success=False, errors=errors)
 
-            # Create user
+            # Prepare the session outside the transaction to keep it short
+            session_key = secrets.token_urlsafe(30)  # Unique 40-char session key
+            ip_address = info.context.META.get("REMOTE_ADDR", "127.0.0.1")
+            user_agent = info.context.META.get("HTTP_USER_AGENT", "")
+
             with transaction.atomic():
-                user = User.objects.create_user(
-                    email=input.email,
-                    username=input.email,  # Use email as username
-                    password=input.password,
-                    first_name=input.first_name,
-                    last_name=input.last_name,
-                    organization=organization,
-                    is_active=True,  # Can be changed to False if email verification is required
-                )
+                # Create user; the unique email constraints reject existing
+                # users without a separate lookup. Only this insert is
+                # guarded, so other integrity errors are not reported as a
+                # duplicate email
+                try:
+                    with transaction.atomic():
+                        user = User.objects.create_user(
+                            email=input.email,
+                            username=input.email,  # Use email as username
+                            password=input.password,
+                            first_name=input.first_name,
+                            last_name=input.last_name,
+                            organization=organization,
+                            is_active=True,  # Can be changed to False if email verification is required
+                        )
+                except IntegrityError:
+                    return AuthPayload(
+                        success=False, errors=["User with this email already exists"]
+                    )
 
                 # Generate JWT tokens
                 access_token, refresh_token, expires_at = generate_jwt_tokens(user)
 
                 # Create user session with unique session key
-                import secrets
-
-                session_key = secrets.token_urlsafe(
-                    30
-                )  # Generate unique 40-char session key
                 UserSession.objects.create(
                     user=user,
                     session_key=session_key,
-                    ip_address=info.context.META.get("REMOTE_ADDR", "127.0.0.1"),
-                    user_agent=info.context.META.get("HTTP_USER_AGENT", ""),
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
 
                 # Send verification email (optional)
@@ -200,23 +205,27 @@ class Login(graphene.Mutation):
                         errors=["User is not a member of this organization"],
                     )
 
-            # Generate JWT tokens
+            # Generate JWT tokens and the session details outside the
+            # transaction to keep it short
             access_token, refresh_token, expires_at = generate_jwt_tokens(user)
+            session_key = secrets.token_urlsafe(30)  # Generate unique session key
+            ip_address = info.context.META.get("REMOTE_ADDR", "127.0.0.1")
+            user_agent = info.context.META.get("HTTP_USER_AGENT", "")
 
             # Create or update user session
             with transaction.atomic():
-                # Invalidate old sessions for this user
-                UserSession.objects.filter(user=user).update(is_active=False)
+                # Invalidate old sessions for this user; only rows that are
+                # still active need rewriting
+                UserSession.objects.filter(user=user, is_active=True).update(
+                    is_active=False
+                )
 
                 # Create new session with unique session key
-                import secrets
-
-                session_key = secrets.token_urlsafe(30)  # Generate unique session key
                 UserSession.objects.create(
                     user=user,
                     session_key=session_key,
-                    ip_address=info.context.META.get("REMOTE_ADDR", "127.0.0.1"),
-                    user_agent=info.context.META.get("HTTP_USER_AGENT", ""),
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
 
             return AuthPayload(
@@ -291,7 +300,9 @@ class Logout(graphene.Mutation):
                 return Logout(success=False, message="Not authenticated")
 
             # Invalidate all sessions for user (since we're not tracking individual refresh tokens in sessions)
-            UserSession.objects.filter(user=user).update(is_active=False)
+            UserSession.objects.filter(user=user, is_active=True).update(
+                is_active=False
+            )
 
             return Logout(success=True, message="Logged out successfully")
 
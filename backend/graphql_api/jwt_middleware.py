@@ -12,6 +12,9 @@ from .utils import get_user_from_jwt_token
 
 User = get_user_model()
 
+# URL prefix of the GraphQL endpoint this middleware authenticates
+GRAPHQL_PATH_PREFIX = "/graphql"
+
 
 class JWTAuthenticationMiddleware(MiddlewareMixin):
     """
@@ -29,34 +32,19 @@ class JWTAuthenticationMiddleware(MiddlewareMixin):
             request: Django HTTP request
         """
         # Skip authentication for non-GraphQL endpoints
-        if not request.path.startswith("/graphql"):
+        if not request.path_info.startswith(GRAPHQL_PATH_PREFIX):
             return None
 
-        # Get Authorization header
+        # Get user from the "Bearer <token>" Authorization header
+        user = None
         auth_header = request.META.get("HTTP_AUTHORIZATION", "")
-
-        if not auth_header.startswith("Bearer "):
-            # No bearer token, use anonymous user
-            request.user = AnonymousUser()
-            request.organization = None
-            return None
-
-        # Extract token
-        token = auth_header.split(" ")[1] if len(auth_header.split(" ")) == 2 else None
-
-        if not token:
-            request.user = AnonymousUser()
-            request.organization = None
-            return None
-
-        # Get user from JWT token
-        user = get_user_from_jwt_token(token)
-
-        if user:
-            request.user = user
-            request.organization = user.organization
-        else:
-            request.user = AnonymousUser()
-            request.organization = None
-
+        if auth_header.startswith("Bearer "):
+            token = auth_header[len("Bearer ") :]
+            if token and " " not in token:
+                user = get_user_from_jwt_token(token)
+
+        # Requests without a valid token are anonymous even if they carry a
+        # session cookie, since the GraphQL view is exempt from CSRF checks
+        request.user = user or AnonymousUser()
+        request.organization = user.organization if user else None
         return None
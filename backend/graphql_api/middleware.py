@@ -5,25 +5,56 @@ This module provides GraphQL middleware to handle authentication
 and organization context in GraphQL resolvers.
 """
 
+import logging
 from django.contrib.auth import get_user_model
 from django.http import HttpRequest
 from graphql import GraphQLError
 from rest_framework.exceptions import AuthenticationFailed
 
 User = get_user_model()
-
-
-class AuthenticationMiddleware:
+logger = logging.getLogger(__name__)
+
+# Schema introspection is always allowed, with or without authentication
+INTROSPECTION_FIELDS = frozenset({"__schema", "__type"})
+
+# Operations that skip authentication
+PUBLIC_OPERATIONS = frozenset(
+    {
+        "login",
+        "register",
+        "refreshToken",
+        "refresh_token",
+        "verifyEmail",
+        "verify_email",
+        "resendVerificationEmail",
+        "resend_verification_email",
+    }
+)
+
+# Operations that skip the organization context check
+ORGANIZATION_EXEMPT_OPERATIONS = PUBLIC_OPERATIONS | {
+    "me",  # Users can access their profile without organization context
+    "createOrganization",  # Users need to create organizations when they don't have one
+    # Temporarily allow project operations for testing Step 15
+    "createProject",
+    "updateProject",
+    "deleteProject",
+    "projects",
+}
+
+
+class AuthenticationAndOrganizationMiddleware:
     """
-    GraphQL middleware for JWT authentication.
+    GraphQL middleware for authentication and organization context.
 
-    This middleware authenticates users using JWT tokens and adds
-    user information to the GraphQL context.
+    This middleware ensures that GraphQL operations are only run by
+    authenticated users and are scoped to the user's organization context.
+    Both checks share a single pass per root field.
     """
 
     def resolve(self, next, root, info, **args):
         """
-        Resolve method for authentication middleware.
+        Resolve method for authentication and organization middleware.
 
         Args:
             next: Next resolver in the chain
@@ -34,125 +65,40 @@ class AuthenticationMiddleware:
         Returns:
             The result of the next resolver
         """
-        request = info.context
-
-        # Debug logging (remove for production)
-        # print(f"DEBUG: Processing field '{info.field_name}' with path: {info.path}")
-
-        # Skip authentication for introspection queries
-        if info.field_name in ["__schema", "__type"]:
+        # Nested fields only resolve once their root field has passed these
+        # checks, so only root fields (those without a parent path) are gated
+        if info.path.prev is not None:
             return next(root, info, **args)
 
-        # Get the root operation type (Query, Mutation)
-        path = info.path
-        root_field_name = None
-        while path and path.prev:
-            path = path.prev
-        if path:
-            root_field_name = path.key
-
-        # Skip authentication for public mutations/queries and their sub-fields
-        public_operations = [
-            "login",
-            "register",
-            "refreshToken",
-            "refresh_token",
-            "verifyEmail",
-            "verify_email",
-            "resendVerificationEmail",
-            "resend_verification_email",
-        ]
-
-        # If this is a sub-field of a public operation, skip authentication
-        if root_field_name in public_operations:
-            print(
-                f"DEBUG: Skipping authentication for sub-field '{info.field_name}' of public operation '{root_field_name}'"
-            )
+        # Skip both checks for introspection queries
+        if info.field_name in INTROSPECTION_FIELDS:
             return next(root, info, **args)
 
-        # If this is a direct public operation, skip authentication
-        if info.field_name in public_operations:
-            print(
-                f"DEBUG: Skipping authentication for public operation: {info.field_name}"
+        # If this is a public operation, skip authentication
+        if info.field_name in PUBLIC_OPERATIONS:
+            logger.debug(
+                "Skipping authentication for public operation: %s", info.field_name
             )
             return next(root, info, **args)
 
-        # Check if user is authenticated
-        if not hasattr(request, "user") or not request.user.is_authenticated:
-            print(f"DEBUG: Authentication required for field: {info.field_name}")
-            raise GraphQLError("Authentication required")
-
-        print(f"DEBUG: User authenticated, proceeding with field: {info.field_name}")
-        return next(root, info, **args)
-
-
-class OrganizationMiddleware:
-    """
-    GraphQL middleware for organization context.
-
-    This middleware ensures that all GraphQL operations are scoped
-    to the user's organization context.
-    """
-
-    def resolve(self, next, root, info, **args):
-        """
-        Resolve method for organization middleware.
-
-        Args:
-            next: Next resolver in the chain
-            root: Root value for the resolver
-            info: GraphQL resolve info
-            **args: Additional arguments
-
-        Returns:
-            The result of the next resolver
-        """
         request = info.context
 
-        # Get the root operation type (Query, Mutation)
-        path = info.path
-        root_field_name = None
-        while path and path.prev:
-            path = path.prev
-        if path:
-            root_field_name = path.key
-
-        # Skip organization context for certain operations and their sub-fields
-        skip_operations = [
-            "login",
-            "register",
-            "refreshToken",
-            "refresh_token",
-            "verifyEmail",
-            "verify_email",
-            "resendVerificationEmail",
-            "resend_verification_email",
-            "me",  # Users can access their profile without organization context
-            "createOrganization",  # Users need to create organizations when they don't have one
-            "__schema",
-            "__type",
-            # Temporarily allow project operations for testing Step 15
-            "createProject",
-            "updateProject",
-            "deleteProject",
-            "projects",
-        ]
-
-        # If this is a sub-field of an operation that doesn't need organization context, skip
-        if root_field_name in skip_operations:
-            return next(root, info, **args)
-
-        # If this is a direct operation that doesn't need organization context, skip
-        if info.field_name in skip_operations:
-            return next(root, info, **args)
+        # Check if user is authenticated
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            logger.debug("Authentication required for field: %s", info.field_name)
+            raise GraphQLError("Authentication required")
 
-        # Ensure user has organization context
-        if hasattr(request, "user") and request.user.is_authenticated:
-            if not hasattr(request, "organization") or not request.organization:
-                if not request.user.organization:
-                    raise GraphQLError("No organization context available")
-                request.organization = request.user.organization
+        # Ensure user has organization context, unless the operation doesn't
+        # need one
+        if info.field_name not in ORGANIZATION_EXEMPT_OPERATIONS and not getattr(
+            request, "organization", None
+        ):
+            if not user.organization:
+                raise GraphQLError("No organization context available")
+            request.organization = user.organization
 
+        logger.debug("User authenticated, proceeding with field: %s", info.field_name)
         return next(root, info, **args)
 
 
@@ -169,12 +115,11 @@ def get_organization_from_context(info):
     Raises:
         GraphQLError: If no organization context is available
     """
-    request = info.context
-
-    if not hasattr(request, "organization") or not request.organization:
+    organization = getattr(info.context, "organization", None)
+    if not organization:
         raise GraphQLError("No organization context available")
 
-    return request.organization
+    return organization
 
 
 def get_user_from_context(info):
@@ -190,9 +135,8 @@ def get_user_from_context(info):
     Raises:
         GraphQLError: If user is not authenticated
     """
-    request = info.context
-
-    if not hasattr(request, "user") or not request.user.is_authenticated:
+    user = getattr(info.context, "user", None)
+    if user is None or not user.is_authenticated:
         raise GraphQLError("Authentication required")
 
-    return request.user
+    return user
@@ -9,7 +9,7 @@ permissions, and organization-based data isolation.
 import graphene
 from graphql import GraphQLError
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from core.models import Organization, Project, Task, TaskComment
@@ -21,7 +21,6 @@ from core.permissions import (
     CanEditProject,
     CanEditTask,
     CanEditComment,
-    filter_queryset_by_organization,
 )
 from .types import (
     OrganizationType,
@@ -45,10 +44,43 @@ from .permissions import (
     can_edit_comment,
 )
 from .middleware import get_organization_from_context, get_user_from_context
+from .auth_mutations import (
+    Register,
+    Login,
+    RefreshToken,
+    Logout,
+    VerifyEmail,
+    ResendVerificationEmail,
+)
 
 User = get_user_model()
 
 
+def _enum_to_str(value):
+    """Return the stored string for a GraphQL enum member or plain value."""
+    return getattr(value, "value", None) or getattr(value, "name", None) or str(value)
+
+
+def _get_default_organization():
+    """
+    Return the default organization used by the task mutations for testing.
+
+    The organization is read through the organization cache, so it is only
+    looked up (or created) in the database on a cache miss.
+    """
+    organization = Organization.objects.get_active_cached(slug="default-org")
+    if organization is None:
+        organization, created = Organization.objects.get_or_create(
+            name="Default Organization",
+            slug="default-org",
+            defaults={
+                "contact_email": "test@example.com",
+                "description": "Default organization for testing",
+            },
+        )
+    return organization
+
+
 # Input Types for Mutations
 class OrganizationInput(graphene.InputObjectType):
     """Input type for organization creation and updates."""
@@ -115,26 +147,32 @@ class CreateOrganization(graphene.Mutation):
                     success=False, errors=["Authentication required"]
                 )
 
-            # Check if slug is unique
-            if Organization.objects.filter(slug=input.slug).exists():
+            # Create organization; the unique slug constraint rejects
+            # duplicates without a separate lookup
+            try:
+                with transaction.atomic():
+                    organization = Organization.objects.create(
+                        name=input.name,
+                        slug=input.slug,
+                        contact_email=input.contact_email,
+                        description=input.get("description", ""),
+                    )
+
+                    # Make the creator an admin of the organization
+                    user.organization = organization
+                    user.is_organization_admin = True
+                    user.save(
+                        update_fields=[
+                            "organization",
+                            "is_organization_admin",
+                            "updated_at",
+                        ]
+                    )
+            except IntegrityError:
                 return CreateOrganization(
                     success=False, errors=["Organization with this slug already exists"]
                 )
 
-            # Create organization
-            with transaction.atomic():
-                organization = Organization.objects.create(
-                    name=input.name,
-                    slug=input.slug,
-                    contact_email=input.contact_email,
-                    description=input.get("description", ""),
-                )
-
-                # Make the creator an admin of the organization
-                user.organization = organization
-                user.is_organization_admin = True
-                user.save()
-
             return CreateOrganization(
                 organization=organization, success=True, errors=[]
             )
@@ -175,23 +213,29 @@ class UpdateOrganization(graphene.Mutation):
             if errors:
                 return UpdateOrganization(success=False, errors=errors)
 
-            # Check if slug is unique (excluding current organization)
-            if (
-                input.slug != organization.slug
-                and Organization.objects.filter(slug=input.slug).exists()
-            ):
-                return UpdateOrganization(
-                    success=False, errors=["Organization with this slug already exists"]
-                )
-
-            # Update organization
+            # Update organization; the unique slug constraint rejects
+            # duplicates without a separate lookup
             organization.name = input.name
             organization.slug = input.slug
             organization.contact_email = input.contact_email
             organization.description = input.get(
                 "description", organization.description
             )
-            organization.save()
+            try:
+                with transaction.atomic():
+                    organization.save(
+                        update_fields=[
+                            "name",
+                            "slug",
+                            "contact_email",
+                            "description",
+                            "updated_at",
+                        ]
+                    )
+            except IntegrityError:
+                return UpdateOrganization(
+                    success=False, errors=["Organization with this slug already exists"]
+                )
 
             return UpdateOrganization(
                 organization=organization, success=True, errors=[]
@@ -219,59 +263,53 @@ class CreateProject(graphene.Mutation):
     def mutate(root, info, input):
         """Create a new project."""
         try:
-            # Get user and try to get/create a default organization for testing
-            user = get_user_from_context(info)
-            organization = user.organization
-
-            # If user has no organization, create a default one for testing
-            if not organization:
-                from core.models import Organization
-
-                organization, created = Organization.objects.get_or_create(
-                    name="Default Organization",
-                    slug="default-org",
-                    defaults={
-                        "contact_email": user.email,
-                        "description": "Default organization for testing",
-                    },
-                )
-                user.organization = organization
-                user.save()
+            with transaction.atomic():
+                # Get user and try to get/create a default organization for testing
+                user = get_user_from_context(info)
+                organization = user.organization
+
+                # If user has no organization, create a default one for testing
+                if not organization:
+                    organization, created = Organization.objects.get_or_create(
+                        name="Default Organization",
+                        slug="default-org",
+                        defaults={
+                            "contact_email": user.email,
+                            "description": "Default organization for testing",
+                        },
+                    )
+                    user.organization = organization
+                    user.save(update_fields=["organization", "updated_at"])
 
-            # Validate input
-            errors = validate_project_input(input)
-            if errors:
-                return CreateProject(success=False, errors=errors)
+                # Validate input
+                errors = validate_project_input(input)
+                if errors:
+                    return CreateProject(success=False, errors=errors)
 
-            # Check if project name is unique within organization
-            project_queryset = Project.objects.filter(
-                organization=organization, name=input.name
-            )
-            if filter_queryset_by_organization(project_queryset, organization).exists():
-                return CreateProject(
-                    success=False,
-                    errors=["Project with this name already exists in organization"],
-                )
+                # Create project
+                # Convert GraphQL enum to string value if needed
+                status_value = _enum_to_str(input.get("status", "PLANNING"))
 
-            # Create project
-            status_value = input.get("status", "PLANNING")
-            # Convert GraphQL enum to string value if needed
-            if hasattr(status_value, "value"):
-                status_value = status_value.value
-            elif hasattr(status_value, "name"):
-                status_value = status_value.name
-            else:
-                status_value = str(status_value)
-
-            project = Project.objects.create(
-                organization=organization,
-                name=input.name,
-                description=input.get("description", ""),
-                status=status_value,
-                due_date=input.get("dueDate"),
-            )
+                # The unique (organization, name) constraint rejects duplicate
+                # project names without a separate lookup
+                try:
+                    with transaction.atomic():
+                        project = Project.objects.create(
+                            organization=organization,
+                            name=input.name,
+                            description=input.get("description", ""),
+                            status=status_value,
+                            due_date=input.get("dueDate"),
+                        )
+                except IntegrityError:
+                    return CreateProject(
+                        success=False,
+                        errors=[
+                            "Project with this name already exists in organization"
+                        ],
+                    )
 
-            return CreateProject(project=project, success=True, errors=[])
+                return CreateProject(project=project, success=True, errors=[])
 
         except Exception as e:
             return CreateProject(success=False, errors=[str(e)])
@@ -306,10 +344,9 @@ class UpdateProject(graphene.Mutation):
 
             # Get project and verify permissions
             try:
-                project_queryset = Project.objects.filter(organization=organization)
-                project = filter_queryset_by_organization(
-                    project_queryset, organization
-                ).get(id=id)
+                project = Project.objects.select_related("organization").get(
+                    id=id, organization=organization
+                )
             except Project.DoesNotExist:
                 return UpdateProject(success=False, errors=["Project not found"])
 
@@ -323,33 +360,33 @@ class UpdateProject(graphene.Mutation):
             if errors:
                 return UpdateProject(success=False, errors=errors)
 
-            # Check if project name is unique within organization (excluding current)
-            if (
-                input.name != project.name
-                and Project.objects.filter(
-                    organization=organization, name=input.name
-                ).exists()
-            ):
-                return UpdateProject(
-                    success=False,
-                    errors=["Project with this name already exists in organization"],
-                )
-
             # Update project
-            status_value = input.get("status", project.status)
             # Convert GraphQL enum to string value if needed
-            if hasattr(status_value, "value"):
-                status_value = status_value.value
-            elif hasattr(status_value, "name"):
-                status_value = status_value.name
-            else:
-                status_value = str(status_value)
+            status_value = _enum_to_str(input.get("status", project.status))
 
             project.name = input.name
             project.description = input.get("description", project.description)
             project.status = status_value
             project.due_date = input.get("dueDate", project.due_date)
-            project.save()
+
+            # The unique (organization, name) constraint rejects duplicate
+            # project names without a separate lookup
+            try:
+                with transaction.atomic():
+                    project.save(
+                        update_fields=[
+                            "name",
+                            "description",
+                            "status",
+                            "due_date",
+                            "updated_at",
+                        ]
+                    )
+            except IntegrityError:
+                return UpdateProject(
+                    success=False,
+                    errors=["Project with this name already exists in organization"],
+                )
 
             return UpdateProject(project=project, success=True, errors=[])
 
@@ -375,7 +412,9 @@ class DeleteProject(graphene.Mutation):
 
             # Get project and verify permissions
             try:
-                project = Project.objects.get(id=id, organization=organization)
+                project = Project.objects.select_related("organization").get(
+                    id=id, organization=organization
+                )
             except Project.DoesNotExist:
                 return DeleteProject(success=False, errors=["Project not found"])
 
@@ -410,81 +449,49 @@ class CreateTask(graphene.Mutation):
     # )  # Temporarily remove authentication for debugging
     def mutate(root, info, input):
         """Create a new task."""
-        print(f"🚀 CreateTask mutation called with input: {input}")
-        print(f"🚀 Input type: {type(input)}")
-        print(f"🚀 Input fields: {dir(input)}")
-        print("🚀 DEBUG: Authentication bypassed for testing")
         try:
-            # For debugging, completely bypass user authentication
-            print(f"🚀 Bypassing user authentication for debugging")
-
-            # For debugging, use a default organization
-            from core.models import Organization
-
-            organization, created = Organization.objects.get_or_create(
-                name="Default Organization",
-                slug="default-org",
-                defaults={
-                    "contact_email": "test@example.com",
-                    "description": "Default organization for testing",
-                },
-            )
-            print(f"🚀 Using organization: {organization}")
-
-            # Validate input
-            errors = validate_task_input(input, organization)
-            if errors:
-                return CreateTask(success=False, errors=errors)
+            with transaction.atomic():
+                # For debugging, completely bypass user authentication and use a
+                # default organization
+                organization = _get_default_organization()
 
-            # Get project (temporarily bypass organization filtering for debugging)
-            try:
-                print(f"🚀 Looking for project ID: {input.project_id}")
+                # Validate input
+                errors = validate_task_input(input, organization)
+                if errors:
+                    return CreateTask(success=False, errors=errors)
 
-                # For debugging, just get any project with this ID
-                project = Project.objects.get(id=input.project_id)
-                print(f"🚀 Found project: {project}")
-            except Project.DoesNotExist:
-                print(f"🚀 Project {input.project_id} not found")
-                # List all available projects for debugging
-                all_projects = Project.objects.all()
-                print(
-                    f"🚀 Available projects: {[(p.id, p.name) for p in all_projects]}"
+                # Get project (temporarily bypass organization filtering for debugging)
+                try:
+                    # For debugging, just get any project with this ID
+                    project = Project.objects.get(id=input.project_id)
+                except Project.DoesNotExist:
+                    return CreateTask(success=False, errors=["Project not found"])
+
+                # Create task
+                # Convert GraphQL enum to string value if needed
+                status_value = _enum_to_str(input.get("status", "TODO"))
+
+                # Use camelCase field names from input
+                assignee_email = getattr(input, 'assigneeEmail', None) or ""
+                due_date = getattr(input, 'dueDate', None)
+                project_id = getattr(input, 'projectId', None)
+
+                # Ensure title is provided for creation (required for business logic)
+                title = getattr(input, 'title', None)
+                if not title:
+                    return CreateTask(success=False, errors=["Title is required for task creation"])
+
+                task = Task.objects.create(
+                    project=project,
+                    title=title,
+                    description=input.description or "",
+                    status=status_value,
+                    assignee_email=assignee_email,
+                    due_date=due_date,
                 )
-                return CreateTask(success=False, errors=["Project not found"])
-
-            # Create task
-            status_value = input.get("status", "TODO")
-            # Convert GraphQL enum to string value if needed
-            if hasattr(status_value, "value"):
-                status_value = status_value.value
-            elif hasattr(status_value, "name"):
-                status_value = status_value.name
-            else:
-                status_value = str(status_value)
-
-            # Use camelCase field names from input
-            assignee_email = getattr(input, 'assigneeEmail', None) or ""
-            due_date = getattr(input, 'dueDate', None)
-            project_id = getattr(input, 'projectId', None)
-
-            # Ensure title is provided for creation (required for business logic)
-            title = getattr(input, 'title', None)
-            if not title:
-                return CreateTask(success=False, errors=["Title is required for task creation"])
-
-            task = Task.objects.create(
-                project=project,
-                title=title,
-                description=input.description or "",
-                status=status_value,
-                assignee_email=assignee_email,
-                due_date=due_date,
-            )
-
-            print(f"🚀 Task created successfully: {task.id} - {task.title}")
 
-            # Return the task object - enum serialization should be fixed now
-            return CreateTask(task=task, success=True, errors=[])
+                # Return the task object - enum serialization should be fixed now
+                return CreateTask(task=task, success=True, errors=[])
 
         except Exception as e:
             return CreateTask(success=False, errors=[str(e)])
@@ -505,77 +512,60 @@ class UpdateTask(graphene.Mutation):
     # @require_permission(IsAuthenticated, IsOrganizationMember)  # Temporarily disabled for debugging
     def mutate(root, info, id, input):
         """Update an existing task."""
-        print(f"🚀 UpdateTask mutation called with id: {id}, input: {input}")
         try:
-            # For debugging, use a default organization like in CreateTask
-            from core.models import Organization
-            
-            organization, created = Organization.objects.get_or_create(
-                name="Default Organization",
-                slug="default-org", 
-                defaults={
-                    "contact_email": "test@example.com",
-                    "description": "Default organization for testing",
-                },
-            )
-            print(f"🚀 Using organization: {organization}")
+            with transaction.atomic():
+                # For debugging, use a default organization like in CreateTask
+                organization = _get_default_organization()
 
-            # Get task (simplified for debugging)
-            try:
-                print(f"🚀 Looking for task ID: {id}")
-                task = Task.objects.get(id=id)
-                print(f"🚀 Found task: {task.id} - {task.title}")
-            except Task.DoesNotExist:
-                print(f"🚀 Task {id} not found")
-                all_tasks = Task.objects.all()
-                print(f"🚀 Available tasks: {[(t.id, t.title) for t in all_tasks]}")
-                return UpdateTask(success=False, errors=["Task not found"])
-
-            # Skip validation temporarily for debugging
-            print(f"🚀 Skipping validation for debugging purposes")
-
-            # Use camelCase field names from input
-            project_id = getattr(input, 'projectId', None)
-            
-            # If project is being changed, verify new project
-            if project_id and str(project_id) != str(task.project_id):
+                # Get task (simplified for debugging)
                 try:
-                    new_project = Project.objects.get(
-                        id=project_id, organization=organization
-                    )
-                    task.project = new_project
-                except Project.DoesNotExist:
-                    return UpdateTask(success=False, errors=["New project not found"])
-
-            # Update task
-            status_value = getattr(input, "status", task.status)
-            # Convert GraphQL enum to string value if needed
-            if hasattr(status_value, "value"):
-                status_value = status_value.value
-            elif hasattr(status_value, "name"):
-                status_value = status_value.name
-            else:
-                status_value = str(status_value)
-
-            # Use camelCase field names from input
-            assignee_email = getattr(input, 'assigneeEmail', None) or task.assignee_email
-            due_date = getattr(input, 'dueDate', None) or task.due_date
-
-            # Update fields only if provided
-            if hasattr(input, 'title') and input.title is not None:
-                task.title = input.title
-            if hasattr(input, 'description') and input.description is not None:
-                task.description = input.description
-            
-            task.status = status_value
-            task.assignee_email = assignee_email
-            task.due_date = due_date
-            task.save()
-
-            print(f"🚀 Task updated successfully: {task.id} - {task.title} - Status: {task.status}")
-            print(f"🚀 Returning UpdateTask with task data")
-            
-            return UpdateTask(task=task, success=True, errors=[])
+                    task = Task.objects.select_related("project", "assignee").get(id=id)
+                except Task.DoesNotExist:
+                    return UpdateTask(success=False, errors=["Task not found"])
+
+                # Skip validation temporarily for debugging
+
+                # Use camelCase field names from input
+                project_id = getattr(input, 'projectId', None)
+
+                # Fields written by the update; optional ones are added as set
+                changed_fields = ["status", "assignee_email", "due_date", "updated_at"]
+
+                # If project is being changed, verify new project
+                if project_id and str(project_id) != str(task.project_id):
+                    try:
+                        new_project = Project.objects.get(
+                            id=project_id, organization=organization
+                        )
+                        task.project = new_project
+                        changed_fields.append("project")
+                    except Project.DoesNotExist:
+                        return UpdateTask(
+                            success=False, errors=["New project not found"]
+                        )
+
+                # Update task
+                # Convert GraphQL enum to string value if needed
+                status_value = _enum_to_str(getattr(input, "status", task.status))
+
+                # Use camelCase field names from input
+                assignee_email = getattr(input, 'assigneeEmail', None) or task.assignee_email
+                due_date = getattr(input, 'dueDate', None) or task.due_date
+
+                # Update fields only if provided
+                if hasattr(input, 'title') and input.title is not None:
+                    task.title = input.title
+                    changed_fields.append("title")
+                if hasattr(input, 'description') and input.description is not None:
+                    task.description = input.description
+                    changed_fields.append("description")
+
+                task.status = status_value
+                task.assignee_email = assignee_email
+                task.due_date = due_date
+                task.save(update_fields=changed_fields)
+
+                return UpdateTask(task=task, success=True, errors=[])
 
         except Exception as e:
             return UpdateTask(success=False, errors=[str(e)])
@@ -599,7 +589,9 @@ class DeleteTask(graphene.Mutation):
 
             # Get task and verify permissions
             try:
-                task = Task.objects.get(id=id, project__organization=organization)
+                task = Task.objects.select_related("project__organization").get(
+                    id=id, project__organization=organization
+                )
             except Task.DoesNotExist:
                 return DeleteTask(success=False, errors=["Task not found"])
 
@@ -648,9 +640,8 @@ class CreateTaskComment(graphene.Mutation):
 
             # Get task and verify it belongs to organization
             try:
-                task_queryset = Task.objects.filter(project__organization=organization)
-                task = filter_queryset_by_organization(task_queryset, organization).get(
-                    id=input.task_id
+                task = Task.objects.select_related("project").get(
+                    id=input.task_id, project__organization=organization
                 )
             except Task.DoesNotExist:
                 return CreateTaskComment(success=False, errors=["Task not found"])
@@ -692,12 +683,9 @@ class UpdateTaskComment(graphene.Mutation):
 
             # Get comment and verify permissions
             try:
-                comment_queryset = TaskComment.objects.filter(
-                    task__project__organization=organization
-                )
-                comment = filter_queryset_by_organization(
-                    comment_queryset, organization
-                ).get(id=id)
+                comment = TaskComment.objects.select_related(
+                    "task__project__organization", "author"
+                ).get(id=id, task__project__organization=organization)
             except TaskComment.DoesNotExist:
                 return UpdateTaskComment(success=False, errors=["Comment not found"])
 
@@ -713,7 +701,7 @@ class UpdateTaskComment(graphene.Mutation):
 
             # Update comment
             comment.content = input.content
-            comment.save()
+            comment.save(update_fields=["content", "updated_at"])
 
             return UpdateTaskComment(comment=comment, success=True, errors=[])
 
@@ -739,9 +727,9 @@ class DeleteTaskComment(graphene.Mutation):
 
             # Get comment and verify permissions
             try:
-                comment = TaskComment.objects.get(
-                    id=id, task__project__organization=organization
-                )
+                comment = TaskComment.objects.select_related(
+                    "task__project__organization"
+                ).get(id=id, task__project__organization=organization)
             except TaskComment.DoesNotExist:
                 return DeleteTaskComment(success=False, errors=["Comment not found"])
 
@@ -759,17 +747,6 @@ class DeleteTaskComment(graphene.Mutation):
             return DeleteTaskComment(success=False, errors=[str(e)])
 
 
-# Import authentication mutations
-from .auth_mutations import (
-    Register,
-    Login,
-    RefreshToken,
-    Logout,
-    VerifyEmail,
-    ResendVerificationEmail,
-)
-
-
 # Main Mutation class combining all mutations
 class Mutation(graphene.ObjectType):
     """
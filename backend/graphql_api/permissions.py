@@ -78,7 +78,7 @@ def require_organization_member(func):
             user = get_user_from_context(info)
             organization = get_organization_from_context(info)
 
-            if not user.organization or user.organization.id != organization.id:
+            if user.organization_id != organization.id:
                 raise GraphQLError("Organization membership required")
 
         except GraphQLError:
@@ -118,7 +118,7 @@ def require_organization_admin(func):
             user = get_user_from_context(info)
             organization = get_organization_from_context(info)
 
-            if not user.organization or user.organization.id != organization.id:
+            if user.organization_id != organization.id:
                 raise GraphQLError("Organization membership required")
 
             if not user.is_organization_admin and not user.is_superuser:
@@ -153,7 +153,7 @@ def can_view_organization(user, organization):
         return True
 
     # Users can view their own organization
-    if user.organization and user.organization.id == organization.id:
+    if user.organization_id == organization.id:
         return True
 
     return False
@@ -178,11 +178,7 @@ def can_edit_organization(user, organization):
         return True
 
     # Organization admins can edit their organization
-    if (
-        user.organization
-        and user.organization.id == organization.id
-        and user.is_organization_admin
-    ):
+    if user.organization_id == organization.id and user.is_organization_admin:
         return True
 
     return False
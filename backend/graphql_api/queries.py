@@ -9,7 +9,17 @@ proper multi-tenant data isolation and access control.
 import graphene
 from graphene import relay
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Count, Avg
+from django.db.models import (
+    Q,
+    Count,
+    Avg,
+    F,
+    DurationField,
+    ExpressionWrapper,
+    IntegerField,
+    OuterRef,
+)
+from django.db.models.functions import Coalesce
 from graphql import GraphQLError
 from core.models import Organization, Project, Task, TaskComment
 from core.context import GraphQLContext
@@ -24,6 +34,7 @@ from core.services import (
     TaskStatisticsService,
     UserProductivityService,
     OrganizationAnalyticsService,
+    correlated_aggregate,
 )
 from .types import (
     UserType,
@@ -206,7 +217,7 @@ class Query(graphene.ObjectType):
         if not organization:
             raise GraphQLError("Organization context required")
 
-        queryset = Project.objects.filter(organization=organization)
+        queryset = Project.objects.for_organization(organization)
         queryset = filter_queryset_by_organization(queryset, organization)
 
         # Apply filters
@@ -237,7 +248,13 @@ class Query(graphene.ObjectType):
             except (ValueError, TypeError):
                 start_offset = 0
 
-        paginated_queryset = queryset[start_offset : start_offset + first]
+        # Task counts are annotated onto the page only, so neither the total
+        # count nor projects outside the page pay for the grouped join
+        page_ids = list(
+            queryset.values_list("pk", flat=True)[start_offset : start_offset + first]
+        )
+        projects = Project.objects.with_task_counts(organization).in_bulk(page_ids)
+        paginated_queryset = [projects[pk] for pk in page_ids if pk in projects]
 
         # Create page info
         has_next = start_offset + first < total_count
@@ -263,7 +280,7 @@ class Query(graphene.ObjectType):
             raise GraphQLError("Organization context required")
 
         try:
-            queryset = Project.objects.filter(organization=organization)
+            queryset = Project.objects.with_task_counts(organization)
             return filter_queryset_by_organization(queryset, organization).get(id=id)
         except Project.DoesNotExist:
             raise GraphQLError(f"Project with ID {id} not found")
@@ -319,7 +336,11 @@ class Query(graphene.ObjectType):
             except (ValueError, TypeError):
                 start_offset = 0
 
-        paginated_queryset = queryset[start_offset : start_offset + first]
+        # Join the rows nested task fields read so they resolve without a
+        # query per task; the total count above does not need the joins
+        paginated_queryset = queryset.select_related(
+            "project", "assignee__organization"
+        )[start_offset : start_offset + first]
 
         # Create page info
         has_next = start_offset + first < total_count
@@ -345,7 +366,9 @@ class Query(graphene.ObjectType):
             raise GraphQLError("Organization context required")
 
         try:
-            queryset = Task.objects.filter(project__organization=organization)
+            queryset = Task.objects.filter(
+                project__organization=organization
+            ).select_related("project", "assignee__organization")
             return filter_queryset_by_organization(queryset, organization).get(id=id)
         except Task.DoesNotExist:
             raise GraphQLError(f"Task with ID {id} not found")
@@ -367,7 +390,9 @@ class Query(graphene.ObjectType):
         except Task.DoesNotExist:
             raise GraphQLError(f"Task with ID {task_id} not found")
 
-        queryset = TaskComment.objects.filter(task=task)
+        queryset = TaskComment.objects.filter(task=task).select_related(
+            "task__project", "author__organization"
+        )
         queryset = filter_queryset_by_organization(queryset, organization).order_by(
             "-created_at"
         )
@@ -472,43 +497,60 @@ class Query(graphene.ObjectType):
 
     def _calculate_project_completion_rate(self, projects):
         """Calculate project completion rate as percentage."""
-        total = projects.count()
-        if total == 0:
-            return 0.0
-        completed = projects.filter(status="COMPLETED").count()
-        return (completed / total) * 100
+        counts = projects.aggregate(
+            total=Count("id"), completed=Count("id", filter=Q(status="COMPLETED"))
+        )
+        return (counts["completed"] / max(counts["total"], 1)) * 100
 
     def _calculate_task_completion_rate(self, tasks):
         """Calculate task completion rate as percentage."""
-        total = tasks.count()
-        if total == 0:
-            return 0.0
-        completed = tasks.filter(status="DONE").count()
-        return (completed / total) * 100
+        counts = tasks.aggregate(
+            total=Count("id"), completed=Count("id", filter=Q(status="DONE"))
+        )
+        return (counts["completed"] / max(counts["total"], 1)) * 100
 
     def _calculate_average_completion_time(self, tasks):
         """Calculate average task completion time in hours."""
-        completed_tasks = tasks.filter(status="DONE").exclude(updated_at__isnull=True)
-        if not completed_tasks.exists():
-            return 0.0
-
-        total_hours = 0
-        count = 0
-        for task in completed_tasks:
-            delta = task.updated_at - task.created_at
-            total_hours += delta.total_seconds() / 3600
-            count += 1
-
-        return total_hours / count if count > 0 else 0.0
+        average_duration = (
+            tasks.filter(status="DONE")
+            .exclude(updated_at__isnull=True)
+            .aggregate(
+                average=Avg(
+                    ExpressionWrapper(
+                        F("updated_at") - F("created_at"), output_field=DurationField()
+                    )
+                )
+            )["average"]
+        )
+        return average_duration.total_seconds() / 3600 if average_duration else 0.0
 
     def _get_most_active_users(self, organization, limit=5):
         """Get most active users based on task assignments and comments."""
         users = User.objects.filter(organization=organization)
 
+        # Count each activity in its own correlated subquery; joining tasks and
+        # comments in one query would multiply rows and require DISTINCT counts
+        assigned_tasks = Task.objects.filter(
+            project__organization=organization, assignee=OuterRef("pk")
+        )
+        comments_made = TaskComment.objects.filter(
+            task__project__organization=organization, author=OuterRef("pk")
+        )
+
         # Annotate users with activity counts
         users_with_activity = users.annotate(
-            assigned_tasks=Count("task", distinct=True),
-            comments_made=Count("taskcomment", distinct=True),
+            assigned_tasks=Coalesce(
+                correlated_aggregate(
+                    assigned_tasks, "assignee", Count("id"), IntegerField()
+                ),
+                0,
+            ),
+            comments_made=Coalesce(
+                correlated_aggregate(
+                    comments_made, "author", Count("id"), IntegerField()
+                ),
+                0,
+            ),
         ).order_by("-assigned_tasks", "-comments_made")[:limit]
 
         return list(users_with_activity)
@@ -182,11 +182,11 @@ class ProjectType(DjangoObjectType):
 
     def resolve_in_progress_task_count(self, info):
         """Return the number of in-progress tasks in this project."""
-        return self.tasks.filter(status="IN_PROGRESS").count()
+        return self.in_progress_task_count
 
     def resolve_todo_task_count(self, info):
         """Return the number of todo tasks in this project."""
-        return self.tasks.filter(status="TODO").count()
+        return self.todo_task_count
 
     def resolve_completion_rate(self, info):
         """Return the completion rate as a percentage."""
@@ -219,19 +219,15 @@ class ProjectType(DjangoObjectType):
         
     def resolve_taskCount(self, info):
         """Return task_count in camelCase for frontend compatibility."""
-        return self.tasks.count()
+        return self.task_count
         
     def resolve_completedTaskCount(self, info):
         """Return completed_task_count in camelCase for frontend compatibility."""
-        return self.tasks.filter(status="DONE").count()
+        return self.completed_task_count
         
     def resolve_completionRate(self, info):
         """Return completion_rate in camelCase for frontend compatibility."""
-        total_tasks = self.tasks.count()
-        if total_tasks == 0:
-            return 0.0
-        completed_tasks = self.tasks.filter(status="DONE").count()
-        return (completed_tasks / total_tasks) * 100.0
+        return float(self.completion_rate)
 
 
 class TaskType(DjangoObjectType):
@@ -290,14 +286,12 @@ class TaskType(DjangoObjectType):
 
     def resolve_assignee(self, info):
         """Return the assigned user if assignee_email matches a user in the organization."""
-        if not self.assignee_email:
-            return None
-        try:
-            return User.objects.get(
-                email=self.assignee_email, organization=self.project.organization
-            )
-        except User.DoesNotExist:
+        # The assignee foreign key mirrors assignee_email and can be joined
+        # by the list resolvers, avoiding a user lookup per task
+        assignee = self.assignee
+        if assignee is None or assignee.organization_id != self.project.organization_id:
             return None
+        return assignee
 
     def resolve_days_remaining(self, info):
         """Return the number of days remaining until the due date."""
@@ -350,14 +344,15 @@ class TaskCommentType(DjangoObjectType):
 
     def resolve_author(self, info):
         """Return the author user if author_email matches a user in the organization."""
-        if not self.author_email:
-            return None
-        try:
-            return User.objects.get(
-                email=self.author_email, organization=self.task.project.organization
-            )
-        except User.DoesNotExist:
+        # The author foreign key mirrors author_email and can be joined by the
+        # list resolvers, avoiding a user lookup per comment
+        author = self.author
+        if (
+            author is None
+            or author.organization_id != self.task.project.organization_id
+        ):
             return None
+        return author
 
 
 # Statistics and Analytics Types
@@ -5,6 +5,7 @@ This module provides utility functions for JWT token handling,
 email services, and other common operations.
 """
 
+import bleach
 import jwt
 import secrets
 from datetime import datetime, timedelta
@@ -37,7 +38,7 @@ def generate_jwt_tokens(user):
     access_payload = {
         "user_id": user.id,
         "email": user.email,
-        "organization_id": user.organization.id if user.organization else None,
+        "organization_id": user.organization_id,
         "is_organization_admin": user.is_organization_admin,
         "exp": access_expires,
         "iat": now,
@@ -108,7 +109,9 @@ def get_user_from_jwt_token(token):
         return None
 
     try:
-        return User.objects.get(id=payload["user_id"], is_active=True)
+        return User.objects.select_related("organization").get(
+            id=payload["user_id"], is_active=True
+        )
     except User.DoesNotExist:
         return None
 
@@ -231,8 +234,6 @@ def sanitize_html(content):
     Returns:
         Sanitized HTML string
     """
-    import bleach
-
     # Allowed tags and attributes
     allowed_tags = [
         "p",
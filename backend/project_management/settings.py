@@ -147,8 +147,7 @@ REST_FRAMEWORK = {
 GRAPHENE = {
     "SCHEMA": "graphql_api.schema.schema",
     "MIDDLEWARE": [
-        # "graphql_api.middleware.AuthenticationMiddleware",  # Temporarily disabled for debugging
-        # "graphql_api.middleware.OrganizationMiddleware",    # Temporarily disabled for debugging
+        # "graphql_api.middleware.AuthenticationAndOrganizationMiddleware",  # Temporarily disabled for debugging
     ],
 }
 
@@ -263,10 +262,16 @@ if not DEBUG:
     CSRF_COOKIE_SECURE = True
 
 # Cache Configuration
+# Cached analytics and organizations are invalidated through this cache, so
+# deployments running more than one process must point it at a shared backend
+# (e.g. Redis or Memcached); the local-memory default only suits a single
+# process.
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="unique-snowflake"),
     }
 }
 